@@ -0,0 +1,148 @@
+# bench.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains a headless benchmark runner. It solves every maze of the
+given directories with every search method and records the wall time, the
+number of explored states, the expanded, generated and reopened states, the
+peak frontier size, the path length and, for the bounded suboptimal
+methods, the cost bound they proved, and checks each path with
+Maze.isValidPath. Results are printed as a table and can be written to JSON
+or CSV, so changes in search.py show up as diffs.
+Nothing here needs pygame or a display.
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import signal
+import sys
+import time
+
+from maze import Maze
+from search import search, SEARCH_METHODS
+from stats import SearchStats
+
+METHODS = list(SEARCH_METHODS)
+MAP_DIRECTORIES = ["maps/single", "maps/corner", "maps/multi", "p1", "p2", "p3", "p4"]
+FIELDS = ["maze", "method", "status", "path_length", "states_explored", "peak_frontier", "expanded", "generated",
+          "reopened", "cost_bound", "seconds", "validation"]
+
+BASE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+class SearchTimeout(Exception):
+    pass
+
+def _raiseTimeout(signum, frame):
+    raise SearchTimeout()
+
+# Returns the sorted maze files of the given directories (relative to this file if not absolute)
+def mazeFiles(directories):
+    files = []
+    for directory in directories:
+        files.extend(glob.glob(os.path.join(BASE_DIRECTORY, directory, "*.txt")))
+        files.extend(glob.glob(os.path.join(BASE_DIRECTORY, directory, "*.txt.gz")))
+    return sorted(files)
+
+# Solves one maze with one method and returns a result row (see FIELDS). The search is
+# interrupted after timeout seconds where SIGALRM is available; a search that raises yields
+# status "error" with the exception in validation.
+def runOne(filename, method, timeout=None, options=None):
+    row = dict.fromkeys(FIELDS)
+    row["maze"] = os.path.relpath(filename, BASE_DIRECTORY)
+    row["method"] = method
+    maze = Maze(filename)
+    stats = SearchStats()
+
+    useAlarm = timeout and hasattr(signal, "setitimer")
+    if useAlarm:
+        previousHandler = signal.signal(signal.SIGALRM, _raiseTimeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    t1 = time.perf_counter()
+    try:
+        path = search(maze, method, stats=stats, **(options or {}))
+    except SearchTimeout:
+        path = None
+        row["status"] = "timeout"
+    except Exception as error:
+        path = None
+        row["status"] = "error"
+        row["validation"] = repr(error)
+    finally:
+        row["seconds"] = round(time.perf_counter() - t1, 4)
+        if useAlarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previousHandler)
+
+    row["states_explored"] = maze.getStatesExplored()
+    row["peak_frontier"] = stats.peakFrontier
+    row["expanded"] = stats.expanded
+    row["generated"] = stats.generated
+    row["reopened"] = stats.reopened
+    row["cost_bound"] = stats.costBound
+    if path is not None:
+        row["path_length"] = len(path)
+        row["validation"] = maze.isValidPath(path)
+        row["status"] = "ok" if row["validation"] == "Valid" else "invalid"
+    return row
+
+def writeJson(rows, filename):
+    with open(filename, "w") as f:
+        json.dump(rows, f, indent=1)
+        f.write("\n")
+
+def writeCsv(rows, filename):
+    with open(filename, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+def printRow(row):
+    print("%-28s %-13s %-8s %6s %9s %8s %9s" % (
+        row["maze"], row["method"], row["status"], row["path_length"],
+        row["states_explored"], row["peak_frontier"], row["seconds"]))
+    sys.stdout.flush()
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='HW1 headless benchmark')
+
+    parser.add_argument('directories', nargs='*', default=MAP_DIRECTORIES,
+                        help='maze directories - default: ' + ' '.join(MAP_DIRECTORIES))
+    parser.add_argument('--methods', dest="methods", type=str, default=",".join(METHODS),
+                        help='comma separated search methods - default all')
+    parser.add_argument('--timeout', dest="timeout", type=float, default=60.0,
+                        help='seconds allowed per search - default 60')
+    parser.add_argument('--time-budget', dest="timeBudget", type=float, default=1.0,
+                        help='fast: seconds spent improving the tour - default 1.0')
+    parser.add_argument('--weight', dest="weight", type=float, default=None,
+                        help='astar_multi, wastar, focal: suboptimality bound (fast: run focal search with it) - default 1 for astar_multi, 1.5 otherwise')
+    parser.add_argument('--json', dest="json", type=str, default=None,
+                        help='write the results to a JSON file')
+    parser.add_argument('--csv', dest="csv", type=str, default=None,
+                        help='write the results to a CSV file')
+
+    args = parser.parse_args()
+    options = {"timeBudget": args.timeBudget}
+    if args.weight is not None:
+        options["weight"] = args.weight
+
+    print("%-28s %-13s %-8s %6s %9s %8s %9s" % (
+        "maze", "method", "status", "length", "explored", "frontier", "seconds"))
+    rows = []
+    for filename in mazeFiles(args.directories):
+        for method in args.methods.split(","):
+            row = runOne(filename, method, args.timeout, options)
+            printRow(row)
+            rows.append(row)
+
+    if args.json is not None:
+        writeJson(rows, args.json)
+    if args.csv is not None:
+        writeCsv(rows, args.csv)
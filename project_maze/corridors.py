@@ -0,0 +1,128 @@
+# corridors.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains the JunctionGraph class, a contracted view of a maze. Every
+1-wide corridor is collapsed into one weighted edge between its two end nodes,
+where a node is a junction, a dead end, an objective or the start. Searches run
+on the nodes and expand edges back into cells only for the final path.
+"""
+
+import os
+from array import array
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
+
+# Largest number of maze files whose graph is kept
+JUNCTION_GRAPH_FILES = 8
+# Graphs already built, per maze file, least recently used first; an entry is reused while the file is unchanged
+_graphs = OrderedDict()
+# Graphs of mazes whose walls were edited after loading, per maze
+_editedGraphs = WeakKeyDictionary()
+
+# Returns the JunctionGraph of a maze, reusing the one built for the same file if its
+# objectives and start still match and its walls were not edited
+def getJunctionGraph(maze):
+    if maze.getWallRevision():
+        graph = _editedGraphs.get(maze)
+        if graph is None or not graph.matches(maze):
+            graph = _editedGraphs[maze] = JunctionGraph(maze)
+        return graph
+    filename = maze.getFilename()
+    try:
+        status = os.stat(filename)
+        key = (os.path.abspath(filename), status.st_mtime_ns, status.st_size)
+    except OSError:
+        key = None
+    graph = _graphs.get(key)
+    if graph is not None and graph.matches(maze):
+        _graphs.move_to_end(key)
+        return graph
+    graph = JunctionGraph(maze)
+    if key is not None:
+        _graphs[key] = graph
+        _graphs.move_to_end(key)
+        if len(_graphs) > JUNCTION_GRAPH_FILES:
+            _graphs.popitem(last=False)
+    return graph
+
+class JunctionGraph:
+    # Finds the nodes of the maze and walks every corridor leaving them
+    def __init__(self, maze):
+        offsets, targets = maze.getAdjacency()
+        self.__offsets, self.__targets = offsets, targets
+        self.objectiveCells = maze.getObjectiveCells()
+        self.startCell = maze.getCellId(*maze.getStart())
+        self.cellCount = maze.getCellCount()
+        self.__shape = maze.getDimensions()
+        self.__wallRevision = maze.getWallRevision()
+        kept = set(self.objectiveCells)
+        kept.add(self.startCell)
+
+        # Cells with other than two neighbors, plus the objectives and the start, are nodes.
+        # nodeIndex[cell] is the node number of a cell, or -1 for corridor cells and walls.
+        self.nodeIndex = array('i', [-1]) * self.cellCount
+        self.nodeCells = array('i')
+        for cell in range(self.cellCount):
+            if maze.isWallId(cell):
+                continue
+            if offsets[cell + 1] - offsets[cell] != 2 or cell in kept:
+                self.nodeIndex[cell] = len(self.nodeCells)
+                self.nodeCells.append(cell)
+
+        # Edges in CSR form: the edges of node n are numbered edgeOffsets[n] to edgeOffsets[n + 1],
+        # edge e leads to node edgeTargets[e], is edgeWeights[e] steps long and starts with cell edgeFirst[e]
+        self.edgeOffsets = array('i', [0]) * (len(self.nodeCells) + 1)
+        self.edgeTargets = array('i')
+        self.edgeWeights = array('i')
+        self.edgeFirst = array('i')
+        for node, cell in enumerate(self.nodeCells):
+            for i in range(offsets[cell], offsets[cell + 1]):
+                end, weight = self.__walk(cell, targets[i])
+                # A corridor looping back to its own node is never part of a shortest path
+                if end != cell:
+                    self.edgeTargets.append(self.nodeIndex[end])
+                    self.edgeWeights.append(weight)
+                    self.edgeFirst.append(targets[i])
+            self.edgeOffsets[node + 1] = len(self.edgeTargets)
+
+    # Follows the corridor entered from cell through first up to the next node.
+    # Returns (node cell, number of steps).
+    def __walk(self, cell, first):
+        offsets, targets, nodeIndex = self.__offsets, self.__targets, self.nodeIndex
+        previous, current, weight = cell, first, 1
+        while nodeIndex[current] < 0:
+            i = offsets[current]
+            following = targets[i] if targets[i] != previous else targets[i + 1]
+            previous, current = current, following
+            weight += 1
+        return current, weight
+
+    # Returns True if the graph was built for a maze of the same shape, walls, objectives and start
+    def matches(self, maze):
+        return (maze.getDimensions() == self.__shape
+                and maze.getWallRevision() == self.__wallRevision
+                and maze.getObjectiveCells() == self.objectiveCells
+                and maze.getCellId(*maze.getStart()) == self.startCell)
+
+    def nodeCount(self):
+        return len(self.nodeCells)
+
+    def edgeCount(self):
+        return len(self.edgeTargets)
+
+    # Returns the cells of edge number edge of node, from the node cell (excluded) to the end node cell (included)
+    def edgeCells(self, node, edge):
+        offsets, targets, nodeIndex = self.__offsets, self.__targets, self.nodeIndex
+        previous, current = self.nodeCells[node], self.edgeFirst[edge]
+        cells = [current]
+        while nodeIndex[current] < 0:
+            i = offsets[current]
+            following = targets[i] if targets[i] != previous else targets[i + 1]
+            previous, current = current, following
+            cells.append(current)
+        return cells
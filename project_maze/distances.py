@@ -0,0 +1,358 @@
+# distances.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains the DistanceOracle class, which holds exact maze distances
+between the objectives and the start of a maze, and from every cell to every
+objective. It is built with one BFS per objective plus one from the start and
+is shared by the multi-objective heuristics, the tour solvers and path checks.
+MST weights over subsets of objectives are kept in an MstMemo shared by every
+oracle of the same maze contents, so they survive across searches (and across
+runs, through resultCache.py).
+"""
+
+from array import array
+from collections import OrderedDict, deque
+from heapq import heapify, heappush, heappop
+from weakref import WeakKeyDictionary
+
+# Oracles already built, per maze; an entry is reused while the maze walls and objectives are unchanged
+_oracles = WeakKeyDictionary()
+# Largest number of MST weights kept per maze, and of mazes whose MST memo is kept
+MST_MEMO_SIZE = 1 << 16
+MST_MEMO_MAZES = 16
+# MST memos per maze content hash, least recently used first
+_mstMemos = OrderedDict()
+
+# Returns the DistanceOracle of a maze, building it on first use
+def getOracle(maze, stats=None):
+    oracle = _oracles.get(maze)
+    if oracle is None or not oracle.matches(maze):
+        oracle = _oracles[maze] = DistanceOracle(maze, stats)
+    return oracle
+
+# Exact maze distances from sourceCell to every cell (-1 for walls and unreachable cells),
+# by one BFS over the neighbor table. Every expanded cell counts as an explored state.
+def bfsDistances(maze, sourceCell, stats=None):
+    trace = stats.trace if stats is not None else None
+    offsets, targets = maze.getAdjacency()
+    distances = array('i', [-1]) * maze.getCellCount()
+    distances[sourceCell] = 0
+    fringe = deque([sourceCell])
+    peakFrontier = 0
+    while fringe:
+        peakFrontier = max(peakFrontier, len(fringe))
+        cell = fringe.popleft()
+        if trace is not None:
+            trace.expand(cell)
+        distance = distances[cell] + 1
+        for i in range(offsets[cell], offsets[cell + 1]):
+            neighbor = targets[i]
+            if distances[neighbor] < 0:
+                distances[neighbor] = distance
+                fringe.append(neighbor)
+                if trace is not None:
+                    trace.push(neighbor)
+    reached = sum(1 for distance in distances if distance >= 0)
+    maze.addStatesExplored(reached)
+    if stats is not None:
+        stats.observeFrontier(peakFrontier)
+        stats.expanded += reached
+        stats.generated += reached
+    return distances
+
+# Returns the MstMemo shared by every maze with the same contents (see Maze.getContentHash)
+def getMstMemo(maze):
+    key = maze.getContentHash()
+    memo = _mstMemos.get(key)
+    if memo is None:
+        memo = _mstMemos[key] = MstMemo()
+        if len(_mstMemos) > MST_MEMO_MAZES:
+            _mstMemos.popitem(last=False)
+    else:
+        _mstMemos.move_to_end(key)
+    return memo
+
+class MstMemo:
+    # Least recently used table of MST weights keyed by objective bitmask, holding at most capacity entries
+    def __init__(self, capacity=MST_MEMO_SIZE):
+        self.capacity = capacity
+        self.weights = OrderedDict()
+        # Weights computed because they were not in the table
+        self.misses = 0
+        # True once resultCache.py has merged the persisted entries, and while new entries are unsaved
+        self.loaded = False
+        self.changed = False
+
+    def __len__(self):
+        return len(self.weights)
+
+    # Returns the weight of mask, or None if it is not in the table
+    def get(self, mask):
+        weight = self.weights.get(mask)
+        if weight is not None:
+            self.weights.move_to_end(mask)
+        return weight
+
+    def put(self, mask, weight):
+        self.weights[mask] = weight
+        self.changed = True
+        if len(self.weights) > self.capacity:
+            self.weights.popitem(last=False)
+
+    # Returns the (mask, weight) entries, least recently used first
+    def items(self):
+        return list(self.weights.items())
+
+    # Adds entries saved with items() without overriding the ones already known, which are more recent
+    def merge(self, items):
+        known = self.weights
+        self.weights = OrderedDict((mask, weight) for mask, weight in items if mask not in known)
+        self.weights.update(known)
+        while len(self.weights) > self.capacity:
+            self.weights.popitem(last=False)
+
+class DistanceOracle:
+    # Runs one BFS from every objective and one from the start of the maze
+    def __init__(self, maze, stats=None):
+        self.__offsets, self.__targets = maze.getAdjacency()
+        self.objectiveCells = maze.getObjectiveCells()
+        self.startCell = maze.getCellId(*maze.getStart())
+        self.goalCount = len(self.objectiveCells)
+        # Node i < goalCount is objective i, node goalCount is the start
+        self.startIndex = self.goalCount
+        self.__nodeCells = self.objectiveCells + (self.startCell,)
+
+        # Per-goal distance fields: fields[goal][cell] is the maze distance from cell to the goal
+        self.fields = [bfsDistances(maze, cell, stats) for cell in self.objectiveCells]
+        startField = bfsDistances(maze, self.startCell, stats)
+
+        # Flat (goalCount + 1) x (goalCount + 1) matrix over objectives and start
+        size = self.goalCount + 1
+        self.__size = size
+        self.__matrix = array('i', [-1]) * (size * size)
+        for i, field in enumerate(self.fields + [startField]):
+            for j, cell in enumerate(self.__nodeCells):
+                self.__matrix[i * size + j] = field[cell]
+        self.__mstMemo = getMstMemo(maze)
+
+    # Returns True if the oracle was built for the current walls and objectives of the maze
+    def matches(self, maze):
+        return (maze.getAdjacency()[1] is self.__targets
+                and maze.getObjectiveCells() is self.objectiveCells
+                and maze.getCellId(*maze.getStart()) == self.startCell)
+
+    # Maze distance from a cell to objective number goal (-1 if unreachable)
+    def dist(self, cell, goal):
+        return self.fields[goal][cell]
+
+    # Maze distance between two nodes (objective numbers, or startIndex for the start)
+    def nodeDistance(self, i, j):
+        return self.__matrix[i * self.__size + j]
+
+    # Returns the goal distance matrix as a list of rows, objectives only
+    def goalMatrix(self):
+        size = self.__size
+        return [list(self.__matrix[i * size:i * size + self.goalCount]) for i in range(self.goalCount)]
+
+    # Returns the full node distance matrix (objectives, then the start) as a list of rows
+    def nodeMatrix(self):
+        size = self.__size
+        return [list(self.__matrix[i * size:(i + 1) * size]) for i in range(size)]
+
+    # Returns True if every objective can be reached from the start
+    def allReachable(self):
+        return all(self.nodeDistance(self.startIndex, goal) >= 0 for goal in range(self.goalCount))
+
+    # Returns the (goal, distance) of the nearest objective of mask from cell, or (-1, -1) if mask is empty
+    def nearestGoal(self, cell, mask):
+        nearest, nearestDistance = -1, -1
+        goal = 0
+        while mask:
+            if mask & 1:
+                distance = self.fields[goal][cell]
+                if nearestDistance < 0 or 0 <= distance < nearestDistance:
+                    nearest, nearestDistance = goal, distance
+            mask >>= 1
+            goal += 1
+        return nearest, nearestDistance
+
+    # Weight of the minimum spanning tree over the objectives of mask, memoized per mask
+    def mstWeight(self, mask):
+        weight = self.__mstMemo.get(mask)
+        if weight is None:
+            weight = self.__primWeight(mask)
+            self.__mstMemo.put(mask, weight)
+            self.__mstMemo.misses += 1
+        return weight
+
+    def __primWeight(self, mask):
+        size, matrix = self.__size, self.__matrix
+        goals = [goal for goal in range(self.goalCount) if mask >> goal & 1]
+        if len(goals) < 2:
+            return 0
+        best = {goal: matrix[goals[0] * size + goal] for goal in goals[1:]}
+        weight = 0
+        while best:
+            goal = min(best, key=best.get)
+            weight += best.pop(goal)
+            for other in best:
+                distance = matrix[goal * size + other]
+                if distance < best[other]:
+                    best[other] = distance
+        return weight
+
+    # Admissible multi-objective heuristic: distance from cell to the nearest objective of mask
+    # plus the MST weight over the objectives of mask
+    def mstHeuristic(self, cell, mask):
+        if mask == 0:
+            return 0
+        return self.nearestGoal(cell, mask)[1] + self.mstWeight(mask)
+
+    # Cost of visiting the objectives in order from the start, by shortest paths
+    def tourLength(self, order):
+        length, previous = 0, self.startIndex
+        for goal in order:
+            length += self.nodeDistance(previous, goal)
+            previous = goal
+        return length
+
+    # Lower bound on the length of any path from the start through every objective
+    def lowerBound(self):
+        return self.mstHeuristic(self.startCell, (1 << self.goalCount) - 1)
+
+    # Returns the cell ids of a shortest path from fromCell to objective number goal, by walking
+    # down its distance field (no search needed), or [] if the goal cannot be reached
+    def shortestPath(self, fromCell, goal):
+        field, offsets, targets = self.fields[goal], self.__offsets, self.__targets
+        if field[fromCell] < 0:
+            return []
+        path = [fromCell]
+        cell = fromCell
+        while field[cell] > 0:
+            distance = field[cell] - 1
+            for i in range(offsets[cell], offsets[cell + 1]):
+                if field[targets[i]] == distance:
+                    cell = targets[i]
+                    break
+            path.append(cell)
+        return path
+
+    # Returns the cell ids of the path that visits the objectives in order from the start
+    def stitchTour(self, order):
+        path = [self.startCell]
+        for goal in order:
+            path.extend(self.shortestPath(path[-1], goal)[1:])
+        return path
+
+class NearestObjectiveField:
+    # Builds the distance from every cell to its nearest objective with one multi-source BFS
+    # seeded with all objective cells (goalCells defaults to every objective of the maze).
+    # The BFS and every later removeObjective count their work in the maze and in stats, and feed its trace.
+    def __init__(self, maze, goalCells=None, stats=None):
+        self.__maze, self.__stats = maze, stats
+        self.__offsets, self.__targets = maze.getAdjacency()
+        if goalCells is None:
+            goalCells = maze.getObjectiveCells()
+        cellCount = maze.getCellCount()
+        # distances[cell] is the distance to the nearest objective, sources[cell] that objective (-1 if none)
+        self.distances = array('i', [-1]) * cellCount
+        self.sources = array('i', [-1]) * cellCount
+        fringe = deque()
+        for goalCell in goalCells:
+            if self.sources[goalCell] < 0:
+                self.distances[goalCell] = 0
+                self.sources[goalCell] = goalCell
+                fringe.append(goalCell)
+        self.__expand(fringe)
+
+    # Heuristic lookup: distance from cell to the nearest remaining objective
+    def distance(self, cell):
+        return self.distances[cell]
+
+    def __expand(self, fringe):
+        offsets, targets, distances, sources = self.__offsets, self.__targets, self.distances, self.sources
+        trace = self.__stats.trace if self.__stats is not None else None
+        expanded, generated, peakFrontier = 0, len(fringe), 0
+        while fringe:
+            peakFrontier = max(peakFrontier, len(fringe))
+            cell = fringe.popleft()
+            expanded += 1
+            if trace is not None:
+                trace.expand(cell)
+            distance, source = distances[cell] + 1, sources[cell]
+            for i in range(offsets[cell], offsets[cell + 1]):
+                neighbor = targets[i]
+                if distances[neighbor] < 0:
+                    distances[neighbor] = distance
+                    sources[neighbor] = source
+                    fringe.append(neighbor)
+                    generated += 1
+                    if trace is not None:
+                        trace.push(neighbor)
+        self.__count(expanded, generated, peakFrontier)
+
+    # Adds the work of one update to the maze's explored counter and to stats
+    def __count(self, expanded, generated, peakFrontier):
+        self.__maze.addStatesExplored(expanded)
+        if self.__stats is not None:
+            self.__stats.observeFrontier(peakFrontier)
+            self.__stats.expanded += expanded
+            self.__stats.generated += generated
+
+    # Drops an objective from the field. Only the cells whose nearest objective was goalCell
+    # change: they are cleared, then refilled from the surrounding cells in distance order.
+    def removeObjective(self, goalCell):
+        offsets, targets, distances, sources = self.__offsets, self.__targets, self.distances, self.sources
+        if sources[goalCell] != goalCell:
+            return
+        trace = self.__stats.trace if self.__stats is not None else None
+
+        # The cells owned by goalCell form a connected region around it
+        region = [goalCell]
+        sources[goalCell] = -1
+        for cell in region:
+            for i in range(offsets[cell], offsets[cell + 1]):
+                neighbor = targets[i]
+                if sources[neighbor] == goalCell:
+                    sources[neighbor] = -1
+                    region.append(neighbor)
+        for cell in region:
+            distances[cell] = -1
+
+        # Seed each region cell with its best neighbor outside the region, then grow by distance
+        seeds = []
+        for cell in region:
+            best, bestSource = -1, -1
+            for i in range(offsets[cell], offsets[cell + 1]):
+                neighbor = targets[i]
+                if sources[neighbor] >= 0 and (best < 0 or distances[neighbor] < best):
+                    best, bestSource = distances[neighbor], sources[neighbor]
+            if best >= 0:
+                seeds.append((best + 1, cell, bestSource))
+                if trace is not None:
+                    trace.push(cell)
+        # Dijkstra over the region: a cell is settled the first time it is popped
+        heapify(seeds)
+        expanded, generated, peakFrontier = 0, len(seeds), 0
+        while seeds:
+            peakFrontier = max(peakFrontier, len(seeds))
+            distance, cell, source = heappop(seeds)
+            if sources[cell] >= 0:
+                continue
+            distances[cell], sources[cell] = distance, source
+            expanded += 1
+            if trace is not None:
+                trace.expand(cell)
+            for i in range(offsets[cell], offsets[cell + 1]):
+                neighbor = targets[i]
+                if sources[neighbor] < 0:
+                    heappush(seeds, (distance + 1, neighbor, source))
+                    generated += 1
+                    if trace is not None:
+                        trace.push(neighbor)
+        self.__count(expanded, generated, peakFrontier)
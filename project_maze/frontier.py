@@ -0,0 +1,127 @@
+# frontier.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains the IndexedPriorityQueue class, the frontier used by the
+A* searches of search.py. It is a binary heap that remembers where each item
+lives, so membership tests are O(1) and decrease-key is O(log n).
+"""
+
+class IndexedPriorityQueue:
+    def __init__(self):
+        # Heap of [priority, count, item] entries, count breaks ties in FIFO order
+        self.heap = []
+        # item -> position of its entry in the heap
+        self.index = {}
+        self.count = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item):
+        return item in self.index
+
+    # Iterates over the queued (item, priority) pairs, in no particular order
+    def __iter__(self):
+        for priority, _, item in self.heap:
+            yield item, priority
+
+    def isEmpty(self):
+        return len(self.heap) == 0
+
+    # Returns the priority of an item in the queue, or None if it is not queued
+    def getPriority(self, item):
+        position = self.index.get(item)
+        if position is None:
+            return None
+        return self.heap[position][0]
+
+    # Returns the (item, priority) pair with the lowest priority without removing it
+    def peek(self):
+        entry = self.heap[0]
+        return entry[2], entry[0]
+
+    # Inserts the item, or lowers its priority if it is already queued with a higher one.
+    # Returns True if the queue changed.
+    def push(self, item, priority):
+        position = self.index.get(item)
+        if position is None:
+            entry = [priority, self.count, item]
+            self.count += 1
+            self.heap.append(entry)
+            self.index[item] = len(self.heap) - 1
+            self.__siftUp(len(self.heap) - 1)
+            return True
+        entry = self.heap[position]
+        if priority >= entry[0]:
+            return False
+        entry[0] = priority
+        self.__siftUp(position)
+        return True
+
+    # Removes and returns the (item, priority) pair with the lowest priority
+    def pop(self):
+        heap = self.heap
+        last = heap.pop()
+        if not heap:
+            del self.index[last[2]]
+            return last[2], last[0]
+        top = heap[0]
+        heap[0] = last
+        self.index[last[2]] = 0
+        del self.index[top[2]]
+        self.__siftDown(0)
+        return top[2], top[0]
+
+    # Removes an item from the queue if it is queued. Returns True if the queue changed.
+    def remove(self, item):
+        position = self.index.pop(item, None)
+        if position is None:
+            return False
+        heap = self.heap
+        last = heap.pop()
+        if position < len(heap):
+            heap[position] = last
+            self.index[last[2]] = position
+            self.__siftUp(position)
+            self.__siftDown(self.index[last[2]])
+        return True
+
+    def __siftUp(self, position):
+        heap = self.heap
+        index = self.index
+        entry = heap[position]
+        while position > 0:
+            parentPosition = (position - 1) >> 1
+            parent = heap[parentPosition]
+            if entry < parent:
+                heap[position] = parent
+                index[parent[2]] = position
+                position = parentPosition
+            else:
+                break
+        heap[position] = entry
+        index[entry[2]] = position
+
+    def __siftDown(self, position):
+        heap = self.heap
+        index = self.index
+        size = len(heap)
+        entry = heap[position]
+        child = 2 * position + 1
+        while child < size:
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if heap[child] < entry:
+                heap[position] = heap[child]
+                index[heap[position][2]] = position
+                position = child
+                child = 2 * position + 1
+            else:
+                break
+        heap[position] = entry
+        index[entry[2]] = position
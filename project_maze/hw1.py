@@ -14,18 +14,32 @@ initializes the pygame context, and handles the interface between the
 game and the search algorithm.
 """
 
-import pygame
 import sys
 import argparse
 import time
-
-from pygame.locals import *
-from agent import Agent
+import json
+
+try:
+    import pygame
+    from pygame.locals import *
+    from agent import Agent
+except ImportError:
+    # pygame is only needed for the window: --headless runs without it
+    pygame = None
 from maze import Maze
-from search import search
+from search import search, SEARCH_METHODS
+from replan import DStarLite
+from stats import SearchStats, SearchTrace, EXPAND
+from render import savePng
+
+# Seconds taken by the animation of a search trace, whatever its length
+REPLAY_SECONDS = 10
 
 class Application:
-    def __init__(self, human=True, scale=20, fps=30,alt_color=False):
+    # traceFile receives the trace of the search, animate replays it in the window before the path is
+    # drawn, and replay names a trace file to animate instead of searching
+    def __init__(self, human=True, scale=20, fps=30,alt_color=False, replan=False, statsFormat=None, headless=False,
+                 traceFile=None, animate=False, replay=None):
         self.running = True
         self.displaySurface = None
         self.scale = scale
@@ -33,6 +47,13 @@ class Application:
         self.windowTitle = "HW1: "
         self.__human = human
         self.alt_color = alt_color
+        self.__replan = replan
+        self.statsFormat = statsFormat
+        self.__headless = headless
+        self.__traceFile = traceFile
+        self.__animate = animate
+        self.__replay = replay
+        self.planner = None
 
     # Initializes the pygame context and certain properties of the maze
     def initialize(self, filename):
@@ -50,36 +71,65 @@ class Application:
         if self.__human:
             self.agentRadius = min(self.blockSizeX, self.blockSizeY) / 4
             self.agent = Agent(self.maze.getStart(), self.maze, self.blockSizeX, self.blockSizeY)
+            if self.__replan:
+                self.planner = DStarLite(self.maze)
 
     # Once the application is initiated, execute is in charge of drawing the game and dealing with the game loop
-    def execute(self, filename, searchMethod, save):
+    def execute(self, filename, searchMethod, save, searchOptions=None):
+        if pygame is None and not self.__headless:
+            print("pygame is not installed: use --headless --save FILE to write the solved maze to an image")
+            raise SystemExit
+
         self.initialize(filename)
 
         if self.maze is None:
             print("No maze created")
             raise SystemExit
 
-        if not self.__human:
+        trace = None
+        if self.__replay is not None:
+            trace, header = SearchTrace.load(self.__replay)
+            if header["maze"] != self.maze.getContentHash():
+                print("Trace", self.__replay, "was not recorded on", filename)
+                raise SystemExit
+            path = [self.maze.getPosition(cell) for cell in trace.path]
+            print("Replaying", len(trace), "events of", header["method"] + (" (truncated)" if trace.truncated else ""))
+        elif not self.__human:
+            if self.__traceFile is not None or self.__animate:
+                trace = SearchTrace()
+                searchOptions = dict(searchOptions or {}, trace=trace)
             t1 = time.time()
-            path = search(self.maze, searchMethod)
+            path = search(self.maze, searchMethod, **(searchOptions or {}))
             total_time = time.time()-t1  #time in seconds
             statesExplored = self.maze.getStatesExplored()
+            if self.__traceFile is not None:
+                trace.save(self.__traceFile, self.maze, searchMethod)
+                print("Trace:", len(trace), "events written to", self.__traceFile + (" (truncated)" if trace.truncated else ""))
         else:
             path, statesExplored = [], 0
 
+        # Without a window the results are printed and the image is written by render.py
+        if self.__headless:
+            self.printResults(searchMethod, path, statesExplored, total_time, searchOptions)
+            savePng(self.maze, path, save, self.scale, self.alt_color)
+            return
+
         pygame.init()
         self.displaySurface = pygame.display.set_mode((self.windowWidth, self.windowHeight), pygame.HWSURFACE)
         self.displaySurface.fill((255, 255, 255))
         pygame.display.flip()
         pygame.display.set_caption(self.windowTitle)
 
-        if self.__human:
+        if self.planner is not None:
+            self.drawPlan()
+        elif self.__human:
             self.drawPlayer()
         else:
-            print("Results")
-            print("Path Length:", len(path))
-            print("States Explored:", statesExplored)
-            print("Total time", total_time,"seconds")
+            if self.__replay is None:
+                self.printResults(searchMethod, path, statesExplored, total_time, searchOptions)
+            if self.__replay is not None or self.__animate:
+                self.drawMaze()
+                self.animateTrace(trace)
             self.drawPath(path)
 
         self.drawMaze()
@@ -104,6 +154,8 @@ class Application:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     raise SystemExit
+                if event.type == MOUSEBUTTONDOWN and self.planner is not None:
+                    self.toggleWall(event.pos[1] // self.blockSizeY, event.pos[0] // self.blockSizeX)
 
             if self.__human:
                 if (keys[K_RIGHT]):
@@ -121,13 +173,81 @@ class Application:
                 self.gameLoop()
 
 
+    # Draws the events of a search trace a few at a time, so that the whole trace plays in about
+    # REPLAY_SECONDS: pushed cells are painted light blue, expanded cells grey
+    def animateTrace(self, trace):
+        pushColor, expandColor = (173, 216, 230), (160, 160, 160)
+        if self.alt_color:
+            pushColor = (255, 228, 181)
+        eventsPerFrame = max(1, -(-len(trace) // (self.fps * REPLAY_SECONDS)))
+        clock = pygame.time.Clock()
+        for count, (event, cell) in enumerate(trace.replay(), 1):
+            row, col = self.maze.getPosition(cell)
+            self.drawSquare(row, col, expandColor if event == EXPAND else pushColor)
+            if count % eventsPerFrame == 0:
+                pygame.display.flip()
+                clock.tick(self.fps)
+                for pygameEvent in pygame.event.get():
+                    if pygameEvent.type == pygame.QUIT:
+                        raise SystemExit
+        pygame.display.flip()
+
+    # Prints the path length, explored states and time of a search, then its statistics and curve if collected
+    def printResults(self, searchMethod, path, statesExplored, total_time, searchOptions):
+        print("Results")
+        print("Path Length:", len(path))
+        print("States Explored:", statesExplored)
+        print("Total time", total_time,"seconds")
+        stats = searchOptions.get("stats") if searchOptions else None
+        if stats is not None and stats.costBound is not None:
+            print("Cost bound: %.3f (path cost / proven lower bound on the optimal cost)" % stats.costBound)
+        if stats is not None and self.statsFormat is not None:
+            self.printStats(searchMethod, path, statesExplored, searchOptions["stats"])
+        if searchOptions and searchOptions.get("curve"):
+            print("Improvement curve (seconds, path cost):")
+            for seconds, cost in searchOptions["curve"]:
+                print("  %.3f %d" % (seconds, cost))
+
+    # Prints the statistics collected during the search, as one JSON object or as one line per value
+    def printStats(self, searchMethod, path, statesExplored, stats):
+        values = {"maze": self.windowTitle[len("HW1: "):], "method": searchMethod,
+                  "path_length": len(path), "states_explored": statesExplored}
+        values.update(stats.asDict())
+        if self.statsFormat == "json":
+            print(json.dumps(values))
+        else:
+            print("Statistics")
+            for name, value in values.items():
+                print("  %s: %s" % (name, value))
+
     # The game loop is where everything is drawn to the context. Only called when a human is playing
     def gameLoop(self):
+        if self.planner is not None and self.planner.startCell != self.maze.getCellId(self.agent.row, self.agent.col):
+            self.planner.moveStart((self.agent.row, self.agent.col))
+            self.drawPlan()
         self.drawObjective()
         self.drawPlayer()
         self.agent.update()
         pygame.display.flip()
 
+    # Toggles the wall under a mouse click (not on the player or an objective) and replans
+    def toggleWall(self, row, col):
+        if not (0 < row < self.gridDim[0] - 1 and 0 < col < self.gridDim[1] - 1):
+            return
+        if (row, col) == (self.agent.row, self.agent.col) or self.maze.isObjective(row, col):
+            return
+        self.planner.setWall(row, col, not self.maze.isWall(row, col))
+        self.drawPlan()
+
+    # Redraws the maze with the planner's current path from the player to the nearest objective
+    def drawPlan(self):
+        self.displaySurface.fill((255, 255, 255))
+        self.drawPath(self.planner.getPath())
+        self.drawMaze()
+        self.drawStart()
+        self.drawObjective()
+        self.drawPlayer()
+
     # Implementation of a color scheme for the path taken
     # If Red-Green does not work for you while debugging (for e.g. color blindness),
     # you can edit the start and end colors by picking appropriate (R, G, B) values
@@ -204,7 +324,7 @@ if __name__ == "__main__":
     parser.add_argument('filename',
                         help='path to maze file [REQUIRED]')
     parser.add_argument('--method', dest="search", type=str, default = "bfs",
-                        choices = ["bfs", "astar_corner", "astar", "fast", "astar_multi"],
+                        choices = list(SEARCH_METHODS),
                         help='search method - default bfs')
     parser.add_argument('--scale', dest="scale", type=int, default = 20,
                         help='scale - default: 20')
@@ -216,8 +336,44 @@ if __name__ == "__main__":
                         help='save output to image file - default not saved')
     parser.add_argument('--altcolor', dest="altcolor", default = False, action = "store_true",
                         help='View in an alternate color scheme.')
+    parser.add_argument('--distance-field', dest="distanceField", default = False, action = "store_true",
+                        help='astar: use a precomputed BFS distance field as heuristic - default False')
+    parser.add_argument('--time-budget', dest="timeBudget", type=float, default = 1.0,
+                        help='fast: seconds spent improving the tour - default 1.0')
+    parser.add_argument('--weight', dest="weight", type=float, default = None,
+                        help='astar_multi, wastar, focal: suboptimality bound, at least 1 (fast: run focal search with this bound) - default 1 for astar_multi, 1.5 for wastar and focal, tour improvement for fast')
+    parser.add_argument('--no-cache', dest="noCache", default = False, action = "store_true",
+                        help='always search, without reading or writing the solved path and MST weight caches - default False')
+    parser.add_argument('--stats', dest="stats", type=str, default = None, choices = ["text", "json"],
+                        help='print search statistics (expanded and generated states, re-openings, peak frontier, heuristic calls and time) - default not printed')
+    parser.add_argument('--stats-memory', dest="statsMemory", default = False, action = "store_true",
+                        help='with --stats, measure the peak memory with tracemalloc instead of timing the heuristic (much slower) - default False')
+    parser.add_argument('--headless', default = False, action = "store_true",
+                        help='write the --save image with render.py, without pygame or a display - default False')
+    parser.add_argument('--trace', dest="trace", type=str, default = None,
+                        help='write the expansions and pushes of the search to a gzip-compressed trace file - default not recorded')
+    parser.add_argument('--animate', default = False, action = "store_true",
+                        help='replay the expansions and pushes of the search before drawing the path - default False')
+    parser.add_argument('--replay', dest="replay", type=str, default = None,
+                        help='animate a trace file written with --trace instead of searching - default None')
+    parser.add_argument('--replan', dest="replan", default = False, action = "store_true",
+                        help='human: show the path to the nearest objective, replanned as you move or click to toggle walls - default False')
 
 
     args = parser.parse_args()
-    app = Application(args.human, args.scale, args.fps,args.altcolor)
-    app.execute(args.filename, args.search, args.save)
+    if args.headless and (args.save is None or args.human):
+        parser.error("--headless needs --save and cannot be used with --human")
+    if (args.animate or args.replay is not None) and (args.headless or args.human):
+        parser.error("--animate and --replay cannot be used with --headless or --human")
+    app = Application(args.human, args.scale, args.fps,args.altcolor, args.replan, args.stats, args.headless,
+                      args.trace, args.animate, args.replay)
+    searchOptions = {"useDistanceField": args.distanceField, "timeBudget": args.timeBudget, "curve": [],
+                     "useCache": not args.noCache}
+    if args.weight is not None:
+        if args.weight < 1:
+            parser.error("--weight must be at least 1")
+        searchOptions["weight"] = args.weight
+    if args.statsMemory and args.stats is None:
+        parser.error("--stats-memory needs --stats")
+    searchOptions["stats"] = SearchStats(detailed=args.stats is not None, traceMemory=args.statsMemory)
+    app.execute(args.filename, args.search, args.save, searchOptions)
@@ -13,9 +13,71 @@ This file contains the Maze class, which reads in a maze file and creates
 a representation of the maze that is exposed through a simple interface.
 """
 
-import re
-import copy
-from collections import Counter
+import gzip
+import hashlib
+import mmap
+import sys
+from array import array
+from contextlib import contextmanager
+from types import MappingProxyType
+
+from corridors import getJunctionGraph
+
+# Translates the wall bitmap into an open-cell bitmap (1 for open cells), and a 0/1 mask into 0xff
+# where it is 0
+_OPEN_TABLE = bytes([1]) + bytes(255)
+_MISSING_TABLE = b'\xff' + bytes(255)
+
+# Number of cells (rounded to whole rows) the neighbor table is built from at a time
+_ADJACENCY_BLOCK = 1 << 16
+
+# Returns the bytewise AND of two equal-length 0/1 byte strings, a block at a time so that the integers stay small
+def _andBytes(a, b):
+    parts = []
+    for i in range(0, len(a), _ADJACENCY_BLOCK):
+        j = min(i + _ADJACENCY_BLOCK, len(a))
+        parts.append((int.from_bytes(a[i:j], 'little') & int.from_bytes(b[i:j], 'little')).to_bytes(j - i, 'little'))
+    return b''.join(parts)
+
+# Returns the integer whose little-endian 32-bit words are 0xffffffff where the 0/1 mask is 0 and 0 where it is 1
+def _missingWords(mask):
+    words = bytearray(4 * len(mask))
+    missing = mask.translate(_MISSING_TABLE)
+    for k in range(4):
+        words[k::4] = missing
+    return int.from_bytes(words, 'little')
+
+# Returns the running sums of the count 32-bit words packed little-endian in an integer, packed the same way.
+# Dividing by 2**32 - 1 multiplies by 1 + 2**32 + 2**64 + ..., which adds each word into every word above
+# it; the sums must stay below 2**32 so that no word carries into the next.
+def _runningSums(words, count):
+    return (((words << 32 * count) - words) // 0xFFFFFFFF) & ((1 << 32 * count) - 1)
+
+# Returns an int array of the little-endian 32-bit words in data
+def _wordArray(data):
+    words = array('i', data)
+    if sys.byteorder == 'big':
+        words.byteswap()
+    return words
+
+# Yields the contents of a maze file as a bytes-like object: a read-only memory map of the file,
+# or the decompressed bytes of a gzip-compressed file
+@contextmanager
+def mazeData(filename):
+    with open(filename, 'rb') as f:
+        if f.read(2) == b'\x1f\x8b':
+            f.seek(0)
+            with gzip.GzipFile(fileobj=f) as compressed:
+                yield compressed.read()
+            return
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            yield b''
+            return
+        with data:
+            yield data
 
 class Maze:
     # Initializes the Maze object by reading the maze from a file
@@ -27,36 +89,142 @@ class Maze:
         self.__start = None
         self.__objective = []
         self.__states_explored = 0
+        self.__wallRevision = 0
 
-        with open(filename) as f:
-            lines = f.readlines()
+        # Wall bitmap indexed by cell id (row * cols + col), built line by line from the file bytes:
+        # the wall character translates to 1 and any other to 0, cells missing from short lines are walls.
+        # Blank lines are skipped and the first line sets the width.
+        wallTable = bytearray(256)
+        wallTable[ord(self.__wallChar)] = 1
+        wallTable = bytes(wallTable)
+        startChar, objectiveChar = self.__startChar.encode(), self.__objectiveChar.encode()
+        self.__walls = bytearray()
+        self.rows = self.cols = 0
+        with mazeData(filename) as data:
+            position, size = 0, len(data)
+            while position < size:
+                end = data.find(b'\n', position)
+                if end < 0:
+                    end = size
+                line = data[position:end].rstrip(b'\r')
+                position = end + 1
+                if not line.strip():
+                    continue
+                if self.rows == 0:
+                    self.cols = len(line)
+                line = line[:self.cols]
+                self.__walls += line.translate(wallTable)
+                if len(line) < self.cols:
+                    self.__walls += b'\x01' * (self.cols - len(line))
+                col = line.rfind(startChar)
+                if col >= 0:
+                    self.__start = (self.rows, col)
+                col = line.find(objectiveChar)
+                while col >= 0:
+                    self.__objective.append((self.rows, col))
+                    col = line.find(objectiveChar, col + 1)
+                self.rows += 1
 
-        lines = list(filter(lambda x: not re.match(r'^\s*$', x), lines))
-        lines = [list(line.strip('\n')) for line in lines]
-
-        self.rows = len(lines)
-        self.cols = len(lines[0])
-        self.mazeRaw = lines
-
-        if (len(self.mazeRaw) != self.rows) or (len(self.mazeRaw[0]) != self.cols):
+        if self.rows == 0 or self.cols == 0:
             print("Maze dimensions incorrect")
             raise SystemExit
             return
 
-        for row in range(len(self.mazeRaw)):
-            for col in range(len(self.mazeRaw[0])):
-                if self.mazeRaw[row][col] == self.__startChar:
-                    self.__start = (row, col)
-                elif self.mazeRaw[row][col] == self.__objectiveChar:
-                    self.__objective.append((row, col))
+        # The neighbor table is built on first use
+        self.__neighborView = None
+        self.__indexObjectives()
+
+    # Builds the objective index: a frozenset for membership tests, objective -> bit number
+    # (objective i is bit 1 << i of a goal bitmask) and cell id -> bit number for the objective cells
+    def __indexObjectives(self):
+        self.__objectiveSet = frozenset(self.__objective)
+        self.__objectiveBits = {}
+        self.__objectiveCells = []
+        self.__objectiveBitByCell = {}
+        for row, col in self.__objective:
+            if (row, col) in self.__objectiveBits:
+                continue
+            cellId = row * self.cols + col
+            self.__objectiveBitByCell[cellId] = len(self.__objectiveCells)
+            self.__objectiveBits[(row, col)] = len(self.__objectiveCells)
+            self.__objectiveCells.append(cellId)
+        self.__objectiveCells = tuple(self.__objectiveCells)
+        self.__objectiveBitsView = MappingProxyType(self.__objectiveBits)
+
+    # Precomputes the neighbor table in CSR form: the neighbors of cell c are
+    # __neighborTargets[__neighborOffsets[c]:__neighborOffsets[c + 1]], in getNeighbors order
+    # (down, up, right, left). Both arrays are sized up front and filled a block of rows at a time with
+    # whole-block operations on the wall bitmap, packing one 32-bit word per cell into an integer where
+    # arithmetic is needed, so no Python code runs per cell.
+    def __buildAdjacency(self):
+        rows, cols, size = self.rows, self.cols, self.rows * self.cols
+        passable = self.__walls.translate(_OPEN_TABLE)
+        # downEdges[cols + c] is 1 if cells c and c + cols are both open and rightEdges[1 + c] if c and c + 1
+        # are, so the up and left masks of a block are the same bytes read cols and 1 cells earlier
+        downEdges = bytes(cols) + _andBytes(passable[:size - cols], passable[cols:]) + bytes(cols)
+        rightEdges = bytearray(b'\x00' + _andBytes(passable[:size - 1], passable[1:]) + b'\x00')
+        rightEdges[cols::cols] = bytes(rows)
+        del passable
+        offsets = array('i', [0]) * (size + 1)
+        targets = array('i', [0]) * (2 * (downEdges.count(1) + rightEdges.count(1)))
+
+        blockCells = max(1, _ADJACENCY_BLOCK // cols) * cols
+        count = min(blockCells, size)
+        full = (1 << 32 * count) - 1
+        ones = full // 0xFFFFFFFF
+        iota = _runningSums(ones, count) - ones
+        for start in range(0, size, blockCells):
+            end = min(start + blockCells, size)
+            if end - start < count:
+                count = end - start
+                full = (1 << 32 * count) - 1
+                ones &= full
+                iota &= full
+            masks = (downEdges[cols + start:cols + end], downEdges[start:end],
+                     rightEdges[start + 1:end + 1], rightEdges[start:end])
+            # The masks hold 0 or 1 per byte, so their sum as integers never carries into the next cell
+            degrees = bytearray(4 * count)
+            degrees[::4] = sum(int.from_bytes(mask, 'little') for mask in masks).to_bytes(count, 'little')
+            sums = _runningSums(int.from_bytes(degrees, 'little') + offsets[start], count)
+            offsets[start + 1:end + 1] = _wordArray(sums.to_bytes(4 * count, 'little'))
+            # Four slots per cell hold the neighbor in each direction, or -1 where there is no edge. A cell id's
+            # high byte is below 0x80, so every run of four 0xff bytes found is a whole -1 slot, and dropping
+            # them leaves the block's targets.
+            slots = bytearray(16 * count)
+            for direction, (mask, delta) in enumerate(zip(masks, (cols, -cols, 1, -1))):
+                first = start + delta
+                # Ids first, first + 1, ...; in the first block the ids below 0 are left at 0, their slots are masked
+                ids = iota + first * ones if first >= 0 else (iota << -32 * first) & full
+                words = (ids | _missingWords(mask)).to_bytes(4 * count, 'little')
+                for k in range(4):
+                    slots[4 * direction + k::16] = words[k::4]
+            targets[offsets[start]:offsets[end]] = _wordArray(slots.replace(b'\xff\xff\xff\xff', b''))
+        self.__neighborOffsets = offsets
+        self.__neighborTargets = targets
+        self.__neighborView = memoryview(targets)
+
+    # Sets or clears the wall at row, col. The neighbor table is rebuilt on its next use, so a series
+    # of edits costs one rebuild, and caches built on the old table (distance oracle, junction graph)
+    # no longer match the maze.
+    def setWall(self, row, col, isWall=True):
+        cellId = row * self.cols + col
+        if self.__walls[cellId] == isWall:
+            return
+        self.__walls[cellId] = 1 if isWall else 0
+        self.__wallRevision += 1
+        self.__neighborView = None
+
+    # Returns the number of setWall edits since the maze was read
+    def getWallRevision(self):
+        return self.__wallRevision
 
     # Returns True if the given position is the location of a wall
     def isWall(self, row, col):
-        return self.mazeRaw[row][col] == self.__wallChar
+        return self.__walls[row * self.cols + col] == 1
 
     # Rturns True if the given position is the location of an objective
     def isObjective(self, row, col):
-        return (row, col) in self.__objective
+        return (row, col) in self.__objectiveSet
 
     # Returns the start position as a tuple of (row, column)
     def getStart(self):
@@ -71,82 +239,182 @@ class Maze:
 
     # Returns the list of objective positions of the maze
     def getObjectives(self):
-        return copy.deepcopy(self.__objective)
+        return list(self.__objective)
 
 
     def setObjectives(self, objectives):
         self.__objective = objectives
+        self.__indexObjectives()
+
+    # Returns the objective positions as a frozenset (shared, not copied)
+    def getObjectiveSet(self):
+        return self.__objectiveSet
+
+    # Returns a read-only mapping from objective position to its bit number in goal bitmasks
+    def getObjectiveIndex(self):
+        return self.__objectiveBitsView
+
+    # Returns the cell ids of the objectives, ordered by bit number
+    def getObjectiveCells(self):
+        return self.__objectiveCells
+
+    # Returns the bit number of the objective at cellId, or -1 if the cell is not an objective
+    def getObjectiveBit(self, cellId):
+        return self.__objectiveBitByCell.get(cellId, -1)
+
+    # Returns the goal bitmask with every objective bit set
+    def getObjectiveMask(self):
+        return (1 << len(self.__objectiveCells)) - 1
 
 
     def getStatesExplored(self):
         return self.__states_explored
 
+    # Adds count expansions to the explored counter, for searches that walk getAdjacency directly
+    def addStatesExplored(self, count=1):
+        self.__states_explored += count
+
     # Check if the agent can move into a specific row and column
     def isValidMove(self, row, col):
-        return row >= 0 and row < self.rows and col >= 0 and col < self.cols and not self.isWall(row, col)
+        return 0 <= row < self.rows and 0 <= col < self.cols and not self.__walls[row * self.cols + col]
 
     # Returns list of neighboing squares that can be moved to from the given row,col
     def getNeighbors(self, row, col):
-        possibleNeighbors = [
-            (row + 1, col),
-            (row - 1, col),
-            (row, col + 1),
-            (row, col - 1)
-        ]
-        neighbors = []
-        for r, c in possibleNeighbors:
-            if self.isValidMove(r,c):
-                neighbors.append((r,c))
+        cols = self.cols
+        cellId = row * cols + col
         self.__states_explored += 1
-        return neighbors
+        if self.__neighborView is None:
+            self.__buildAdjacency()
+        return [divmod(neighbor, cols) for neighbor in
+                self.__neighborView[self.__neighborOffsets[cellId]:self.__neighborOffsets[cellId + 1]]]
+
+    # Returns the number of cells (walls included) of the maze; cell ids range over [0, getCellCount())
+    def getCellCount(self):
+        return self.rows * self.cols
+
+    # Returns the integer id of the cell at row, col
+    def getCellId(self, row, col):
+        return row * self.cols + col
+
+    # Returns the (row, col) position of a cell id
+    def getPosition(self, cellId):
+        return divmod(cellId, self.cols)
+
+    # Returns the wall bitmap (1 for walls, indexed by cell id) as a read-only view
+    def getWalls(self):
+        return memoryview(self.__walls).toreadonly()
+
+    # Returns True if the given cell id is a wall
+    def isWallId(self, cellId):
+        return self.__walls[cellId] == 1
 
+    # Returns the neighbor ids of a cell as a read-only view on the neighbor table (no list is built).
+    # Counts as one explored state, like getNeighbors.
+    def getNeighborIds(self, cellId):
+        self.__states_explored += 1
+        if self.__neighborView is None:
+            self.__buildAdjacency()
+        return self.__neighborView[self.__neighborOffsets[cellId]:self.__neighborOffsets[cellId + 1]]
+
+    # Returns the (offsets, targets) CSR neighbor arrays for tight loops, without counting explored states
+    def getAdjacency(self):
+        if self.__neighborView is None:
+            self.__buildAdjacency()
+        return self.__neighborOffsets, self.__neighborTargets
+
+    # Returns a hash of the current maze contents (size, walls, start and objectives). It does not
+    # depend on how the file was stored (plain or gzip, line endings), so it can key on-disk caches.
+    def getContentHash(self):
+        digest = hashlib.sha256()
+        digest.update(repr((self.rows, self.cols, self.__start, self.__objective)).encode())
+        digest.update(self.__walls)
+        return digest.hexdigest()
+
+    # Returns the name of the file the maze was read from
+    def getFilename(self):
+        return self.__filename
+
+    # Returns the JunctionGraph of the maze (corridors contracted into weighted edges between
+    # junctions, dead ends, objectives and the start), built once per maze file
+    def getJunctionGraph(self):
+        return getJunctionGraph(self)
+
+    # Returns "Valid" if the path is a valid solution of the maze, or a description of the first problem found
     def isValidPath(self, path):
+        return self.checkPath(path)["message"]
+
+    # Checks a path in a single pass. Returns a dict with the isValidPath message, plus the index in the
+    # path and the position the problem was found at (both None if it does not concern one position).
+    def checkPath(self, path):
+        def result(message, index=None, position=None):
+            return {"valid": message == "Valid", "message": message, "index": index, "position": position}
+
         # check if path is in correct shape (type, not empty)
         if not isinstance(path, list):
-            return "path must be list"
+            return result("path must be list")
 
         if len(path) == 0:
-            return "path must not be empty"
+            return result("path must not be empty")
 
         if not isinstance(path[0], tuple):
-            return "position must be tuple"
+            return result("position must be tuple", 0, path[0])
 
         if len(path[0]) != 2:
-            return "position must be (x, y)"
+            return result("position must be (x, y)", 0, path[0])
+
+        cols, objectiveBits = self.cols, self.__objectiveBitByCell
+        hopError = moveError = None
+        goalsPassed = bytearray(len(self.__objectiveCells))
+        goalCount = 0
+        # A position visited again is a duplicate unless an objective was passed since one of its
+        # earlier visits: lastSeen[cell] is the number of objectives passed at the cell's last visit,
+        # repeatState[cell] is 1 once the cell is repeated and 2 once an objective justified a repeat
+        lastSeen = {}
+        repeatState = {}
+        objectivesPassed = 0
+        for i, position in enumerate(path):
+            # check single hop (a diagonal step is two hops)
+            if hopError is None and i > 0:
+                prev = path[i-1]
+                if abs(prev[0]-position[0]) + abs(prev[1]-position[1]) > 1:
+                    hopError = i
+            # check whether it is valid move
+            if not self.isValidMove(position[0], position[1]):
+                if moveError is None:
+                    moveError = i
+                continue
+            cellId = position[0] * cols + position[1]
+            seen = lastSeen.get(cellId)
+            if seen is not None:
+                if objectivesPassed > seen:
+                    repeatState[cellId] = 2
+                elif cellId not in repeatState:
+                    repeatState[cellId] = 1
+            bit = objectiveBits.get(cellId, -1)
+            if bit >= 0:
+                objectivesPassed += 1
+                if not goalsPassed[bit]:
+                    goalsPassed[bit] = 1
+                    goalCount += 1
+            lastSeen[cellId] = objectivesPassed
 
-        # check single hop
-        for i in range(1, len(path)):
-            prev = path[i-1]
-            cur = path[i]
-            dist = abs((prev[1]-cur[1])+(prev[0]-cur[0]))
-            if dist > 1:
-                return "Not single hop"
+        if hopError is not None:
+            return result("Not single hop", hopError, path[hopError])
 
-        # check whether it is valid move
-        for pos in path:
-            if not self.isValidMove(pos[0], pos[1]):
-                return "Not valid move"
+        if moveError is not None:
+            return result("Not valid move", moveError, path[moveError])
 
         # check whether it passes all goals
-        if not set(self.__objective).issubset(set(path)):
-            return "Not all goals passed"
+        if goalCount != len(goalsPassed):
+            missing = goalsPassed.index(0)
+            return result("Not all goals passed", None, self.getPosition(self.__objectiveCells[missing]))
 
         # check whether it ends up at one of goals
-        if not path[-1] in self.__objective:
-            return "Last position is not goal"
+        if path[-1][0] * cols + path[-1][1] not in objectiveBits:
+            return result("Last position is not goal", len(path) - 1, path[-1])
 
         # check for duplication
-        if len(set(path)) != len(path):
-            c = Counter(path)
-            dup_dots = [p for p in set(c.elements()) if c[p] >= 2]
-            for p in dup_dots:
-                indices = [i for i, dot in enumerate(path) if dot == p]
-                is_dup = True
-                for i in range(len(indices) - 1):
-                    for dot in path[indices[i]+1: indices[i + 1]]:
-                        if self.isObjective(dot[0], dot[1]):
-                            is_dup = False
-                            break
-                if is_dup:
-                    return "Unnecessary path detected"
-        return "Valid"
+        for i, position in enumerate(path):
+            if repeatState.get(position[0] * cols + position[1]) == 1:
+                return result("Unnecessary path detected", i, position)
+        return result("Valid")
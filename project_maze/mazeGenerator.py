@@ -0,0 +1,199 @@
+# mazeGenerator.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains a seeded maze generator. It writes perfect mazes, braided
+mazes (perfect mazes with dead ends opened into loops), open rooms with
+scattered walls, and dotted multi-objective mazes in the '%'/'P'/'.' format
+read by Maze, from a few cells up to millions. Next to each maze it writes a
+JSON sidecar with the reference path length of the maze, exact when it can be
+computed (one objective, or few enough for Held-Karp) and bounded otherwise.
+The same kind, size and seed always give the same maze.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import time
+from collections import deque
+
+from maze import Maze
+from distances import getOracle
+from search import HELD_KARP_LIMIT, heldKarpOrder
+from tours import nearestNeighborTour, improveTour
+
+KINDS = ["perfect", "braided", "rooms", "dotted"]
+# Objectives placed when --dots is not given
+DEFAULT_DOTS = {"perfect": 1, "braided": 1, "rooms": 1, "dotted": 20}
+# Seconds spent improving the upper bound tour when the exact path length is out of reach
+UPPER_BOUND_BUDGET = 1.0
+
+SIDES = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+# Carves a perfect maze (exactly one path between any two open cells) with an iterative randomized
+# depth-first search. Open cells sit at odd rows and columns; returns the wall bitmap (1 for walls).
+def perfectMaze(rows, cols, generator):
+    walls = bytearray(b'\x01') * (rows * cols)
+    start = cols + 1
+    walls[start] = 0
+    stack = [start]
+    while stack:
+        cell = stack[-1]
+        row, col = divmod(cell, cols)
+        options = []
+        for dr, dc in SIDES:
+            nextRow, nextCol = row + 2 * dr, col + 2 * dc
+            if 0 < nextRow < rows - 1 and 0 < nextCol < cols - 1 and walls[nextRow * cols + nextCol]:
+                options.append((dr, dc))
+        if not options:
+            stack.pop()
+            continue
+        dr, dc = generator.choice(options)
+        walls[(row + dr) * cols + col + dc] = 0
+        nextCell = (row + 2 * dr) * cols + col + 2 * dc
+        walls[nextCell] = 0
+        stack.append(nextCell)
+    return walls
+
+# Opens a fraction of the dead ends of a perfect maze into one of their neighbor cells, adding loops
+def braid(walls, rows, cols, generator, fraction=0.5):
+    for row in range(1, rows - 1, 2):
+        for col in range(1, cols - 1, 2):
+            cell = row * cols + col
+            if walls[cell]:
+                continue
+            # A dead end has a single opening
+            openings = sum(1 for dr, dc in SIDES if not walls[(row + dr) * cols + col + dc])
+            if openings != 1 or generator.random() >= fraction:
+                continue
+            closed = [(dr, dc) for dr, dc in SIDES if walls[(row + dr) * cols + col + dc]
+                      and 0 < row + 2 * dr < rows - 1 and 0 < col + 2 * dc < cols - 1]
+            if closed:
+                dr, dc = generator.choice(closed)
+                walls[(row + dr) * cols + col + dc] = 0
+    return walls
+
+# An open area bordered by walls, with each inner cell a wall with probability density
+def openRooms(rows, cols, generator, density=0.2):
+    walls = bytearray(b'\x01') * (rows * cols)
+    for row in range(1, rows - 1):
+        for col in range(1, cols - 1):
+            if generator.random() >= density:
+                walls[row * cols + col] = 0
+    return walls
+
+# Returns the open cells connected to cell, in BFS order
+# (the border is all walls, so neighbor ids never wrap around a row)
+def component(walls, cols, cell):
+    seen = bytearray(len(walls))
+    seen[cell] = 1
+    fringe = deque([cell])
+    order = []
+    while fringe:
+        cell = fringe.popleft()
+        order.append(cell)
+        for neighbor in (cell + cols, cell - cols, cell + 1, cell - 1):
+            if not walls[neighbor] and not seen[neighbor]:
+                seen[neighbor] = 1
+                fringe.append(neighbor)
+    return order
+
+# Generates a maze and returns its text lines. The start and the dots are drawn among the open cells
+# connected to the first open cell, so every objective is reachable.
+def generate(kind, rows, cols, seed=0, dots=None):
+    if kind not in KINDS:
+        raise ValueError("unknown maze kind: " + kind)
+    if rows < 3 or cols < 3:
+        raise ValueError("a maze needs at least 3 rows and 3 columns")
+    generator = random.Random(seed)
+    if kind == "rooms":
+        walls = openRooms(rows, cols, generator)
+    else:
+        walls = perfectMaze(rows, cols, generator)
+        if kind != "perfect":
+            walls = braid(walls, rows, cols, generator)
+    if dots is None:
+        dots = DEFAULT_DOTS[kind]
+
+    first = walls.find(0)
+    if first < 0:
+        raise ValueError("the generated maze has no open cell")
+    cells = component(walls, cols, first)
+    if len(cells) < dots + 1:
+        raise ValueError("the generated maze has fewer than %d connected open cells" % (dots + 1))
+    chosen = generator.sample(cells, dots + 1)
+
+    text = walls.translate(bytes.maketrans(b'\x00\x01', b' %'))
+    text[chosen[0]] = ord('P')
+    for cell in chosen[1:]:
+        text[cell] = ord('.')
+    return [text[row * cols:(row + 1) * cols].decode() for row in range(rows)]
+
+# Writes the lines of a maze, gzip-compressed if the filename ends with .gz
+def writeMaze(lines, filename):
+    data = ("\n".join(lines) + "\n").encode()
+    opener = gzip.open if filename.endswith(".gz") else open
+    with opener(filename, "wb") as f:
+        f.write(data)
+
+# Name of the JSON sidecar of a maze file: bigMaze.txt and bigMaze.txt.gz both give bigMaze.json
+def sidecarName(filename):
+    base = filename[:-3] if filename.endswith(".gz") else filename
+    return os.path.splitext(base)[0] + ".json"
+
+# Reference path lengths (positions, like len(path)) of a maze file. "path_length" is the optimal
+# length when it is known; otherwise "lower_bound" comes from the MST heuristic and "upper_bound"
+# from an improved nearest-neighbor tour.
+def referenceCosts(filename):
+    maze = Maze(filename)
+    oracle = getOracle(maze)
+    reference = {"objectives": oracle.goalCount}
+    if not oracle.allReachable():
+        reference["path_length"] = None
+    elif oracle.goalCount <= HELD_KARP_LIMIT:
+        reference["path_length"] = oracle.tourLength(heldKarpOrder(oracle)) + 1
+    else:
+        distances = oracle.nodeMatrix()
+        lowerBound = oracle.lowerBound()
+        order = nearestNeighborTour(oracle.goalCount, distances, oracle.startIndex)
+        order = improveTour(order, distances, oracle.startIndex, time.perf_counter() + UPPER_BOUND_BUDGET,
+                            lowerBound=lowerBound)
+        reference["lower_bound"] = lowerBound + 1
+        reference["upper_bound"] = oracle.tourLength(order) + 1
+    return reference
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='HW1 maze generator')
+
+    parser.add_argument('kind', choices=KINDS,
+                        help='kind of maze')
+    parser.add_argument('filename',
+                        help='maze file to write, gzip-compressed if it ends with .gz [REQUIRED]')
+    parser.add_argument('--rows', dest="rows", type=int, default=31,
+                        help='number of rows - default 31')
+    parser.add_argument('--cols', dest="cols", type=int, default=31,
+                        help='number of columns - default 31')
+    parser.add_argument('--seed', dest="seed", type=int, default=0,
+                        help='random seed - default 0')
+    parser.add_argument('--dots', dest="dots", type=int, default=None,
+                        help='number of objectives - default 20 for dotted mazes, 1 otherwise')
+    parser.add_argument('--no-reference', dest="reference", default=True, action="store_false",
+                        help='do not compute the reference path length sidecar')
+
+    args = parser.parse_args()
+    writeMaze(generate(args.kind, args.rows, args.cols, args.seed, args.dots), args.filename)
+    metadata = {"kind": args.kind, "rows": args.rows, "cols": args.cols, "seed": args.seed,
+                "dots": args.dots if args.dots is not None else DEFAULT_DOTS[args.kind]}
+    if args.reference:
+        metadata.update(referenceCosts(args.filename))
+    with open(sidecarName(args.filename), "w") as f:
+        json.dump(metadata, f, indent=1)
+        f.write("\n")
+    print(json.dumps(metadata))
@@ -0,0 +1,137 @@
+# render.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains a headless renderer that writes a maze and a path to a PNG
+file with the colors of hw1.py, without pygame or a display. The image is a
+palette PNG built one scanline at a time with bytes operations (translate,
+slice assignment) and streamed through zlib, so mazes with millions of cells
+render quickly and without holding the whole image in memory.
+"""
+
+import argparse
+import struct
+import zlib
+
+# Palette indices: the path gradient uses every index from PATH_INDEX to 255
+EMPTY_INDEX, WALL_INDEX, OBJECTIVE_INDEX, START_INDEX, PATH_INDEX = 0, 1, 2, 3, 4
+PATH_COLORS = 256 - PATH_INDEX
+# Below this scale the start and objective markers fill their whole cell
+MARKER_SCALE = 4
+
+# Returns the 256 color palette: background, walls, objectives, start, then the path gradient
+# (the start and end colors of Application.getColor in hw1.py)
+def palette(alt_color=False):
+    if alt_color:
+        startColor, endColor = (64, 224, 208), (139, 0, 139)
+    else:
+        startColor, endColor = (255, 0, 0), (0, 255, 0)
+    colors = [(255, 255, 255), (0, 0, 0), (0, 0, 0), (0, 0, 255)]
+    for i in range(PATH_COLORS):
+        colors.append(tuple(int(start + (end - start) * i / PATH_COLORS) for start, end in zip(startColor, endColor)))
+    return colors
+
+# Repeats every byte of line scale times
+def expand(line, scale):
+    if scale == 1:
+        return bytearray(line)
+    expanded = bytearray(len(line) * scale)
+    for offset in range(scale):
+        expanded[offset::scale] = line
+    return expanded
+
+# Yields the scanlines of the image (palette indices, one byte per pixel) of a maze with a path
+# drawn as in hw1.py: path below the walls, start and objective markers on top
+def scanlines(maze, path=(), scale=1):
+    rows, cols = maze.getDimensions()
+    walls = maze.getWalls()
+    wallTable = bytes([EMPTY_INDEX, WALL_INDEX]) + bytes(254)
+
+    # Cells to paint per row; a cell visited twice keeps the color of its last visit
+    pathByRow = {}
+    for index, (row, col) in enumerate(path):
+        pathByRow.setdefault(row, {})[col] = PATH_INDEX + index * PATH_COLORS // len(path)
+    markersByRow = {}
+    start = maze.getStart()
+    if start is not None:
+        markersByRow.setdefault(start[0], {})[start[1]] = START_INDEX
+    for row, col in maze.getObjectives():
+        markersByRow.setdefault(row, {})[col] = OBJECTIVE_INDEX
+
+    markerOffset, markerSize = scale // 4, max(scale // 2, 1)
+    for row in range(rows):
+        line = bytearray(bytes(walls[row * cols:(row + 1) * cols]).translate(wallTable))
+        for col, color in pathByRow.get(row, {}).items():
+            line[col] = color
+        markers = markersByRow.get(row)
+        if markers and scale < MARKER_SCALE:
+            for col, color in markers.items():
+                line[col] = color
+            markers = None
+        plain = expand(line, scale)
+        if not markers:
+            for _ in range(scale):
+                yield plain
+            continue
+        marked = bytearray(plain)
+        for col, color in markers.items():
+            left = col * scale + markerOffset
+            marked[left:left + markerSize] = bytes([color]) * markerSize
+        for y in range(scale):
+            yield marked if markerOffset <= y < markerOffset + markerSize else plain
+
+def _chunk(kind, data):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+# Writes a palette PNG from an iterable of scanlines, compressing them as they come
+def writePng(filename, width, height, colors, lines):
+    compressor = zlib.compressobj(6)
+    with open(filename, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 3, 0, 0, 0)))
+        f.write(_chunk(b"PLTE", b"".join(bytes(color) for color in colors)))
+        pending = []
+        pendingSize = 0
+        for line in lines:
+            # Filter type 0 (none) for every scanline
+            data = compressor.compress(b"\x00" + line)
+            if data:
+                pending.append(data)
+                pendingSize += len(data)
+            if pendingSize >= 1 << 20:
+                f.write(_chunk(b"IDAT", b"".join(pending)))
+                pending, pendingSize = [], 0
+        pending.append(compressor.flush())
+        f.write(_chunk(b"IDAT", b"".join(pending)))
+        f.write(_chunk(b"IEND", b""))
+
+# Renders a maze and a path (list of (row, col) positions) to a PNG file, scale pixels per cell
+def savePng(maze, path, filename, scale=1, alt_color=False):
+    rows, cols = maze.getDimensions()
+    writePng(filename, cols * scale, rows * scale, palette(alt_color), scanlines(maze, path, scale))
+
+if __name__ == "__main__":
+    from maze import Maze
+    from search import search, SEARCH_METHODS
+
+    parser = argparse.ArgumentParser(description='HW1 headless renderer')
+
+    parser.add_argument('filename',
+                        help='path to maze file [REQUIRED]')
+    parser.add_argument('output',
+                        help='PNG file to write [REQUIRED]')
+    parser.add_argument('--method', dest="search", type=str, default=None, choices=list(SEARCH_METHODS),
+                        help='search method whose path is drawn - default no path')
+    parser.add_argument('--scale', dest="scale", type=int, default=1,
+                        help='pixels per cell - default 1')
+    parser.add_argument('--altcolor', dest="altcolor", default=False, action="store_true",
+                        help='View in an alternate color scheme.')
+
+    args = parser.parse_args()
+    maze = Maze(args.filename)
+    path = search(maze, args.search) if args.search is not None else []
+    savePng(maze, path, args.output, args.scale, args.altcolor)
@@ -0,0 +1,146 @@
+# replan.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains the DStarLite class, an incremental planner for mazes that
+change while they are being walked. It keeps the shortest-path tree from every
+cell to the nearest objective; when walls are toggled, the start moves or an
+objective is dropped, only the cells whose distance changes are reexpanded.
+"""
+
+from frontier import IndexedPriorityQueue
+
+INFINITY = float('inf')
+
+class DStarLite:
+    # Plans from the start of the maze to its nearest objective. start and goals, given as
+    # (row, col) positions, default to the start and the objectives of the maze.
+    def __init__(self, maze, start=None, goals=None, stats=None):
+        self.maze = maze
+        self.stats = stats
+        self.cols = maze.cols
+        if start is None:
+            start = maze.getStart()
+        if goals is None:
+            goals = maze.getObjectives()
+        self.startCell = maze.getCellId(*start)
+        self.goalCells = set(maze.getCellId(*goal) for goal in goals)
+
+        # g is the current distance estimate of a cell, rhs the one-step lookahead from its neighbors.
+        # A cell is consistent when both agree; the queue holds the inconsistent ones.
+        self.g = [INFINITY] * maze.getCellCount()
+        self.rhs = [INFINITY] * maze.getCellCount()
+        # Offset added to the keys queued before the start moved, so they need not be recomputed
+        self.km = 0
+        self.fringe = IndexedPriorityQueue()
+        for goalCell in self.goalCells:
+            self.rhs[goalCell] = 0
+            self.fringe.push(goalCell, self.__key(goalCell))
+
+    # Manhattan distance from the start to a cell (the search runs backward, from the goals)
+    def __heuristic(self, cell):
+        startRow, startCol = divmod(self.startCell, self.cols)
+        row, col = divmod(cell, self.cols)
+        return abs(startRow - row) + abs(startCol - col)
+
+    def __key(self, cell):
+        distance = min(self.g[cell], self.rhs[cell])
+        return (distance + self.__heuristic(cell) + self.km, distance)
+
+    # Open neighbors of a cell, read from the wall bitmap so that edits need no table rebuild
+    def __neighbors(self, cell):
+        row, col = divmod(cell, self.cols)
+        isValidMove = self.maze.isValidMove
+        neighbors = []
+        for nextRow, nextCol in ((row + 1, col), (row - 1, col), (row, col + 1), (row, col - 1)):
+            if isValidMove(nextRow, nextCol):
+                neighbors.append(nextRow * self.cols + nextCol)
+        return neighbors
+
+    def __updateCell(self, cell):
+        if cell not in self.goalCells:
+            if self.maze.isWallId(cell):
+                self.rhs[cell] = INFINITY
+            else:
+                self.rhs[cell] = min((self.g[neighbor] + 1 for neighbor in self.__neighbors(cell)), default=INFINITY)
+        self.fringe.remove(cell)
+        if self.g[cell] != self.rhs[cell]:
+            self.fringe.push(cell, self.__key(cell))
+            if self.stats is not None:
+                self.stats.generated += 1
+                if self.stats.trace is not None:
+                    self.stats.trace.push(cell)
+
+    # Expands inconsistent cells until the distance of the start is exact
+    def computeShortestPath(self):
+        g, rhs, fringe, startCell = self.g, self.rhs, self.fringe, self.startCell
+        while not fringe.isEmpty() and (fringe.peek()[1] < self.__key(startCell) or rhs[startCell] != g[startCell]):
+            if self.stats is not None:
+                self.stats.observeFrontier(len(fringe))
+                self.stats.expanded += 1
+            cell, oldKey = fringe.pop()
+            if self.stats is not None and self.stats.trace is not None:
+                self.stats.trace.expand(cell)
+            self.maze.addStatesExplored()
+            newKey = self.__key(cell)
+            if oldKey < newKey:
+                fringe.push(cell, newKey)
+            elif g[cell] > rhs[cell]:
+                g[cell] = rhs[cell]
+                for neighbor in self.__neighbors(cell):
+                    self.__updateCell(neighbor)
+            else:
+                g[cell] = INFINITY
+                self.__updateCell(cell)
+                for neighbor in self.__neighbors(cell):
+                    self.__updateCell(neighbor)
+
+    # Moves the start of the planner to position, e.g. after the agent took a step.
+    # The start of the maze itself is left unchanged.
+    def moveStart(self, position):
+        cell = self.maze.getCellId(*position)
+        self.km += self.__heuristic(cell)
+        self.startCell = cell
+
+    # Sets or clears the wall at row, col in the maze and repairs the cells around it
+    def setWall(self, row, col, isWall=True):
+        if self.maze.isWall(row, col) == isWall:
+            return
+        self.maze.setWall(row, col, isWall)
+        cell = row * self.cols + col
+        self.__updateCell(cell)
+        for neighbor in self.__neighbors(cell):
+            self.__updateCell(neighbor)
+
+    # Drops an objective (e.g. once it is reached); the cells that led to it are repaired
+    def removeGoal(self, position):
+        cell = self.maze.getCellId(*position)
+        if cell in self.goalCells:
+            self.goalCells.discard(cell)
+            self.__updateCell(cell)
+
+    # Adds an objective at position
+    def addGoal(self, position):
+        cell = self.maze.getCellId(*position)
+        if cell not in self.goalCells:
+            self.goalCells.add(cell)
+            self.rhs[cell] = 0
+            self.__updateCell(cell)
+
+    # Replans and returns the path from the start to the nearest objective as (row, col) positions,
+    # or [] if no objective can be reached
+    def getPath(self):
+        self.computeShortestPath()
+        g = self.g
+        cell = self.startCell
+        if g[cell] == INFINITY:
+            return []
+        path = [cell]
+        while cell not in self.goalCells:
+            cell = min(self.__neighbors(cell), key=g.__getitem__)
+            path.append(cell)
+        return [divmod(cell, self.cols) for cell in path]
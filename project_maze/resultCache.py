@@ -0,0 +1,133 @@
+# resultCache.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains the on-disk cache of solved paths used by search(..., useCache=True).
+An entry is keyed by the maze contents, the search method and its options, and a
+hash of the search code, so editing search.py (or the modules it relies on)
+starts from an empty cache. Cached paths are checked with Maze.isValidPath,
+and must begin at the maze start, before they are returned. Entries live under
+$XDG_CACHE_HOME/project_maze (~/.cache/project_maze by default); a cache that
+cannot be written is skipped.
+The MST weights memoized by distances.py for a maze are saved there as well,
+so later searches of the same maze start with a warm heuristic table.
+"""
+
+import hashlib
+import json
+import os
+
+from distances import getMstMemo
+
+BASE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+# Modules whose source is part of the code version
+CODE_FILES = ["search.py", "maze.py", "distances.py", "tours.py", "frontier.py",
+              "corridors.py", "replan.py", "stats.py"]
+# Options that only collect output and do not change the path
+OUTPUT_OPTIONS = {"stats", "curve"}
+
+_codeVersion = None
+
+# Root directory of the on-disk caches
+def cacheDirectory():
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(root, "project_maze")
+
+# Hash of the sources of CODE_FILES, computed once per process
+def codeVersion():
+    global _codeVersion
+    if _codeVersion is None:
+        digest = hashlib.sha256()
+        for name in CODE_FILES:
+            with open(os.path.join(BASE_DIRECTORY, name), "rb") as f:
+                digest.update(f.read())
+        _codeVersion = digest.hexdigest()
+    return _codeVersion
+
+# Cache key of a search: maze contents, method, path-changing options and code version
+def resultKey(maze, method, options):
+    keyOptions = {name: value for name, value in options.items() if name not in OUTPUT_OPTIONS}
+    digest = hashlib.sha256()
+    digest.update(maze.getContentHash().encode())
+    digest.update(method.encode())
+    digest.update(json.dumps(keyOptions, sort_keys=True, default=repr).encode())
+    digest.update(codeVersion().encode())
+    return digest.hexdigest()
+
+def resultFile(key):
+    return os.path.join(cacheDirectory(), "results", key[:2], key + ".json")
+
+# Returns the cached result of a search as a dict with "path" (list of (row, col) tuples),
+# "states_explored" and "stats", or None if there is no entry or its path is not a solution of the maze
+def loadResult(maze, method, options):
+    try:
+        with open(resultFile(resultKey(maze, method, options))) as f:
+            entry = json.load(f)
+        entry["path"] = [tuple(position) for position in entry["path"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if not isSolution(maze, entry["path"]):
+        return None
+    return entry
+
+# Returns True if path is valid for the maze and begins at its start (isValidPath checks every hop
+# and objective, but not where the path begins)
+def isSolution(maze, path):
+    return bool(path) and path[0] == maze.getStart() and maze.isValidPath(path) == "Valid"
+
+# Saves the result of a search. Invalid paths are not cached; write errors are ignored.
+def storeResult(maze, method, options, path, statesExplored, stats=None):
+    if not isSolution(maze, path):
+        return
+    entry = {"method": method, "path": path, "states_explored": statesExplored,
+             "stats": stats.asDict() if stats is not None else {}}
+    filename = resultFile(resultKey(maze, method, options))
+    try:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        # Write then rename, so concurrent runs never read a partial entry
+        temporary = "%s.%d.tmp" % (filename, os.getpid())
+        with open(temporary, "w") as f:
+            json.dump(entry, f)
+        os.replace(temporary, filename)
+    except OSError:
+        pass
+
+def mstMemoFile(maze):
+    return os.path.join(cacheDirectory(), "mst", maze.getContentHash() + ".json")
+
+# Merges the saved MST weights of the maze into its shared MstMemo, once per memo
+def loadMstMemo(maze):
+    memo = getMstMemo(maze)
+    if memo.loaded:
+        return memo
+    memo.loaded = True
+    try:
+        with open(mstMemoFile(maze)) as f:
+            entry = json.load(f)
+        if entry["code_version"] == codeVersion():
+            memo.merge((int(mask, 16), weight) for mask, weight in entry["weights"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return memo
+
+# Saves the MST weights of the maze if new ones were computed since the last save; write errors are ignored
+def storeMstMemo(maze):
+    memo = getMstMemo(maze)
+    if not memo.changed:
+        return
+    memo.changed = False
+    filename = mstMemoFile(maze)
+    entry = {"code_version": codeVersion(),
+             "weights": [("%x" % mask, weight) for mask, weight in memo.items()]}
+    try:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        temporary = "%s.%d.tmp" % (filename, os.getpid())
+        with open(temporary, "w") as f:
+            json.dump(entry, f)
+        os.replace(temporary, filename)
+    except OSError:
+        pass
@@ -17,20 +17,63 @@ files and classes when code is run, so be careful to not modify anything else.
 # The path should be a list of tuples in the form (row, col) that correspond
 # to the positions of the path taken by your search algorithm.
 # maze is a Maze object based on the maze from the file specified by input filename
-# searchMethod is the search method specified by --method flag (bfs,dfs,astar,astar_multi,fast)
-from maze import Maze
-from queue import PriorityQueue
+# searchMethod is the search method specified by --method flag (bfs,astar,astar_corner,astar_multi,fast,bibfs,biastar,jps,junction,idastar,dstar,wastar,focal)
+from array import array
+from collections import deque
+from frontier import IndexedPriorityQueue
+from distances import getOracle, NearestObjectiveField
+from inspect import signature
+from tours import nearestNeighborTour, improveTour
+from stats import SearchStats
+from replan import DStarLite
+from resultCache import loadResult, storeResult, loadMstMemo, storeMstMemo
+import time
 from math import sqrt, floor
-import operator
 
-def search(maze, searchMethod):
-    return {
-        "bfs": bfs,
-        "astar": astar,
-        "astar_corner": astar_corner,
-        "astar_multi": astar_multi,
-        "fast": fast,
-    }.get(searchMethod)(maze)
+# Extra keyword options are passed on to the search method if it accepts them.
+# With useCache, a valid path already solved for the same maze, method, options and search code is
+# returned from the on-disk cache of resultCache.py, and new results are added to it. The MST weights
+# memoized for the maze's multi-objective heuristic are loaded from and saved to the same cache.
+# With a SearchTrace, the expansions and pushes of the search and the path found are recorded in it;
+# traced searches always run, since a cached result has nothing to replay.
+def search(maze, searchMethod, useCache=False, trace=None, **options):
+    method = SEARCH_METHODS.get(searchMethod)
+    accepted = signature(method).parameters
+    options = {name: value for name, value in options.items() if name in accepted}
+    stats = options.get("stats")
+    if trace is not None:
+        # The search cores report into the trace through their stats collector
+        if stats is None and "stats" in accepted:
+            options["stats"] = SearchStats()
+        if "stats" in options:
+            options["stats"].trace = trace
+        useCache = False
+    if stats is not None:
+        stats.start()
+    try:
+        if not useCache:
+            path = method(maze, **options)
+            if trace is not None:
+                trace.path = array('i', [maze.getCellId(row, col) for row, col in path])
+            return path
+
+        cached = loadResult(maze, searchMethod, options)
+        if cached is not None:
+            maze.addStatesExplored(cached["states_explored"])
+            if stats is not None:
+                stats.restore(cached["stats"])
+            return cached["path"]
+        loadMstMemo(maze)
+        statesExplored = maze.getStatesExplored()
+        path = method(maze, **options)
+        storeResult(maze, searchMethod, options, path, maze.getStatesExplored() - statesExplored, stats)
+        storeMstMemo(maze)
+        return path
+    finally:
+        if stats is not None:
+            stats.stop()
+        if trace is not None and "stats" in options:
+            options["stats"].trace = None
 
 # Return the Manhattan distance between to 2-uple
 def manhattanDistance(a, b) :
@@ -67,257 +110,877 @@ def sumObjective(currentPosition, objectivePositions, distance):
     return sumValue
 
 
-# Return a boolean indicating if we achieved all the objetives
-def objectiveAchieved(objectivePositions, reachedObjective):
-    for (r,c) in objectivePositions :
-        if (r, c) not in reachedObjective : 
-            return False
-    return True
-
-# Return a tuple t indicating if an element (integer, t-uple (r,c), t-uple (r,c) ancestor)is in a queue
-# t[0] = is the element in the queue | t[1] = integer associated with the element 
-def queueContains(queue, element):
-    for item in queue:
-        if item[1] == element :
-            return True, item[0], item[2]
-    return False, -1, (-1,-1)
-
-# Return the position if a position is in a (position, ancestorPosition) list
-# else return -1
-def containsPosition(currentPosition, positionList):
-    for i in range(len(positionList)) : 
-        if currentPosition == positionList[i][0] :
-            return positionList[i]
-    return -1
-
-# Reconstruct a path from a position to the start position
-def reconstructPath(finishPosition, startPosition, exploredPositionList, objectivePositions):
-    path = [finishPosition[0]]
-    currentPosition = finishPosition
-    while (startPosition not in path):
-        for i in range(len(exploredPositionList)):
-            if exploredPositionList[i][0] == currentPosition[1] :
-                #print("We found the acestor of " + str(currentPosition[0]))
-                path.insert(0, currentPosition[1])
-                currentPosition = exploredPositionList[i]
+# Rebuild the list of cell ids ending at finishCell by following the parent map back to the
+# start (the only cell that is its own parent). Runs in time linear in the path length.
+def reconstructPath(finishCell, parents):
+    path = [finishCell]
+    cell = finishCell
+    while parents[cell] != cell:
+        cell = parents[cell]
+        path.append(cell)
+    path.reverse()
     return path
 
-def bfs(maze):
+# Convert a list of cell ids into the list of (row, col) positions returned by the search methods
+def toPositions(maze, cells):
+    return [maze.getPosition(cell) for cell in cells]
+
+# Shared search core: runs BFS (heuristic is None) or A* (heuristic(cellId) -> int) from
+# startCell until one of goalCells is expanded, and returns the cell ids of the path to it
+# ([] if unreachable). Cells are integer ids and the parent map is a flat array indexed by
+# cell id that doubles as the visited set, so every membership check is O(1).
+def searchToGoal(maze, startCell, goalCells, heuristic=None, stats=None):
+    if stats is None:
+        stats = SearchStats()
+    trace = stats.trace
+    parents = array('i', [-1]) * maze.getCellCount()
+    parents[startCell] = startCell
+
+    if heuristic is None:
+        fringe = deque([startCell])
+        while fringe:
+            stats.observeFrontier(len(fringe))
+            cell = fringe.popleft()
+            if cell in goalCells:
+                return reconstructPath(cell, parents)
+            stats.expanded += 1
+            if trace is not None:
+                trace.expand(cell)
+            for neighbor in maze.getNeighborIds(cell):
+                if parents[neighbor] < 0:
+                    parents[neighbor] = cell
+                    fringe.append(neighbor)
+                    stats.generated += 1
+                    if trace is not None:
+                        trace.push(neighbor)
+        return []
+
+    # A* over an indexed frontier: re-discovering a queued cell with a lower
+    # g-value is a decrease-key instead of a linear remove and re-insert
+    heuristic = stats.heuristic(heuristic)
+    gValues = {startCell: 0}
+    closed = bytearray(maze.getCellCount())
+    fringe = IndexedPriorityQueue()
+    hStart = heuristic(startCell)
+    # Ties on f are broken towards smaller h, i.e. deeper cells, so an exact heuristic walks straight to the goal
+    fringe.push(startCell, (hStart, hStart))
+    while not fringe.isEmpty():
+        stats.observeFrontier(len(fringe))
+        cell, (fValue, hValue) = fringe.pop()
+        gValue = fValue - hValue
+        closed[cell] = 1
+        if cell in goalCells:
+            return reconstructPath(cell, parents)
+        stats.expanded += 1
+        if trace is not None:
+            trace.expand(cell)
+        gNeighbor = gValue + 1
+        for neighbor in maze.getNeighborIds(cell):
+            if not closed[neighbor] and gNeighbor < gValues.get(neighbor, gNeighbor + 1):
+                gValues[neighbor] = gNeighbor
+                parents[neighbor] = cell
+                hNeighbor = heuristic(neighbor)
+                fringe.push(neighbor, (gNeighbor + hNeighbor, hNeighbor))
+                stats.generated += 1
+                if trace is not None:
+                    trace.push(neighbor)
+    return []
+
+# Visit every objective of the maze, each time searching from the last reached objective to the
+# next one found by the search core. Returns the concatenated path, or [] if an objective is unreachable.
+# With a NearestObjectiveField, the heuristic is a lookup in the field, which is updated as objectives are reached.
+# segmentSearch(maze, startCell, goalCells, stats) replaces the search core for each leg when given.
+def chaseObjectives(maze, heuristic=None, distanceField=None, stats=None, segmentSearch=None):
+    cell = maze.getCellId(*maze.getStart())
+    remaining = set(maze.getObjectiveCells())
+    pathCells = [cell]
+    reached = [cell]
+    while True:
+        # Objectives crossed on the way are reached as well
+        for goalCell in remaining.intersection(reached):
+            remaining.discard(goalCell)
+            if distanceField is not None:
+                distanceField.removeObjective(goalCell)
+        if not remaining:
+            return toPositions(maze, pathCells)
+        if segmentSearch is not None:
+            segment = segmentSearch(maze, cell, remaining, stats)
+        elif distanceField is not None:
+            segment = searchToGoal(maze, cell, remaining, distanceField.distances.__getitem__, stats)
+        elif heuristic is None:
+            segment = searchToGoal(maze, cell, remaining, stats=stats)
+        else:
+            objectivePositions = toPositions(maze, remaining)
+            segment = searchToGoal(maze, cell, remaining,
+                                   lambda c: heuristic(maze.getPosition(c), objectivePositions), stats)
+        if not segment:
+            return []
+        pathCells.extend(segment[1:])
+        cell = segment[-1]
+        reached = segment
+
+# Heuristic used by the A* methods: Manhattan distance to the closest remaining objective
+def closestManhattan(position, objectivePositions):
+    return closestObjective(position, objectivePositions, manhattanDistance)[1]
+
+def bfs(maze, stats=None):
     """
     Runs BFS for part 1 of the assignment.
 
     @param maze: The maze to execute the search on.
+    @param stats: optional SearchStats collector
 
     @return path: a list of tuples containing the coordinates of each state in the computed path
     """
+    return chaseObjectives(maze, stats=stats)
 
-    # Retrieving the starting position
-    startPosition = Maze.getStart(maze)
 
-    # Retrieving the objectives position
-    objectivePositions = Maze.getObjectives(maze)
+def astar(maze, useDistanceField=False, stats=None):
+    """
+    Runs A star for part 1 of the assignment.
 
-    # Declaring reached objectives
-    reachedObjectives = []
+    @param maze: The maze to execute the search on.
+    @param useDistanceField: use the exact distance to the nearest remaining objective, precomputed
+        by a multi-source BFS, as the heuristic instead of the Manhattan distance
+    @param stats: optional SearchStats collector
 
-    # Not explored yet position
-    notExploredPositionList = []
+    @return path: a list of tuples containing the coordinates of each state in the computed path
+    """
+    if useDistanceField:
+        return chaseObjectives(maze, distanceField=NearestObjectiveField(maze, stats=stats), stats=stats)
+    return chaseObjectives(maze, closestManhattan, stats=stats)
+
+# Returns the (start, goal) cell ids of a maze with exactly one objective, or None otherwise
+def singleGoal(maze):
+    objectiveCells = maze.getObjectiveCells()
+    if len(objectiveCells) != 1:
+        return None
+    return maze.getCellId(*maze.getStart()), objectiveCells[0]
+
+# Joins the forward parent chain start -> meet and the backward parent chain meet -> goal
+def joinPaths(meetCell, forwardParents, backwardParents):
+    path = reconstructPath(meetCell, forwardParents)
+    cell = meetCell
+    while backwardParents[cell] != cell:
+        cell = backwardParents[cell]
+        path.append(cell)
+    return path
 
-    # Already explored position
-    exploredPositionList = [(startPosition, (-1,-1))]
+def bibfs(maze, stats=None):
+    """
+    Runs bidirectional BFS on a maze with a single objective (other mazes go to bfs).
 
-    # Path list
-    pathList = [startPosition]
-    
-    # Adding the first neighbors in the unexplored positions
-    positionNeighbors = Maze.getNeighbors(maze, startPosition[0], startPosition[1])
-    for r, c in positionNeighbors:
-        notExploredPositionList.append(((r,c), startPosition))
+    The side with the smaller frontier expands one full layer at a time. Once a layer
+    touches the other side, the best meeting cell of that layer gives a shortest path.
 
-    # Iterating while **the** objective (used only for a maze with one objective) is not in the path
-    while (True):
-        # Verify that there is a solution
-        if (len(notExploredPositionList) == 0):
-            return []
-        nextPosition = notExploredPositionList.pop(0)
-        exploredPositionList.append(nextPosition)
-        # If the next position is an objective then add it to the list of reached objectives
-        if (nextPosition[0] in objectivePositions) and not(nextPosition[0] in reachedObjectives):
-            reachedObjectives.append(nextPosition[0])
-            newPath = reconstructPath(nextPosition, startPosition, exploredPositionList, objectivePositions)
-            newPath.pop(0)
-            pathList = pathList + newPath
-            # We reached an objectif, now we have to reach another one
-            startPosition = nextPosition[0]
-            notExploredPositionList = []
-            exploredPositionList = [(nextPosition[0], (-1,-1))]
-        # The objectives are all reached return the pathList
-        if objectiveAchieved(objectivePositions, reachedObjectives) :
-            return pathList
-        newNeighbors = Maze.getNeighbors(maze, nextPosition[0][0], nextPosition[0][1])
-        for r, c in newNeighbors:
-            if (containsPosition((r,c), exploredPositionList) == -1) and (containsPosition((r,c), notExploredPositionList) == -1):
-                notExploredPositionList.append(((r,c), nextPosition[0]))
-
-
-def astar(maze):
+    @param maze: The maze to execute the search on.
+    @param stats: optional SearchStats collector
+
+    @return path: a list of tuples containing the coordinates of each state in the computed path
     """
-    Runs A star for part 1 of the assignment.
+    cells = singleGoal(maze)
+    if cells is None:
+        return bfs(maze, stats=stats)
+    if stats is None:
+        stats = SearchStats()
+    startCell, goalCell = cells
+    if startCell == goalCell:
+        return [maze.getPosition(startCell)]
+    trace = stats.trace
+
+    cellCount = maze.getCellCount()
+    # parents[side] doubles as the visited set, distances[side] holds BFS depths
+    parents = (array('i', [-1]) * cellCount, array('i', [-1]) * cellCount)
+    distances = (array('i', [-1]) * cellCount, array('i', [-1]) * cellCount)
+    fringes = ([startCell], [goalCell])
+    for side, cell in ((0, startCell), (1, goalCell)):
+        parents[side][cell] = cell
+        distances[side][cell] = 0
+
+    while fringes[0] and fringes[1]:
+        stats.observeFrontier(len(fringes[0]) + len(fringes[1]))
+        side = 0 if len(fringes[0]) <= len(fringes[1]) else 1
+        ownParents, ownDistances = parents[side], distances[side]
+        otherDistances = distances[1 - side]
+        bestCell, bestLength = -1, -1
+        nextLayer = []
+        stats.expanded += len(fringes[side])
+        for cell in fringes[side]:
+            if trace is not None:
+                trace.expand(cell)
+            distance = ownDistances[cell] + 1
+            for neighbor in maze.getNeighborIds(cell):
+                if ownParents[neighbor] < 0:
+                    ownParents[neighbor] = cell
+                    ownDistances[neighbor] = distance
+                    nextLayer.append(neighbor)
+                    stats.generated += 1
+                    if trace is not None:
+                        trace.push(neighbor)
+                    if otherDistances[neighbor] >= 0:
+                        length = distance + otherDistances[neighbor]
+                        if bestLength < 0 or length < bestLength:
+                            bestCell, bestLength = neighbor, length
+        if bestCell >= 0:
+            return toPositions(maze, joinPaths(bestCell, parents[0], parents[1]))
+        fringes = (nextLayer, fringes[1]) if side == 0 else (fringes[0], nextLayer)
+    return []
+
+def biastar(maze, stats=None):
+    """
+    Runs bidirectional A* on a maze with a single objective (other mazes go to astar).
+
+    Both sides use the average potential p(v) = (hf(v) - hb(v)) / 2, where hf and hb are the
+    Manhattan distances to the goal and to the start: the forward key is gf(v) + p(v) and the
+    backward key gb(v) - p(v). p is consistent in both directions, so each side settles cells
+    with exact distances, and for any path not found yet the smallest forward key plus the
+    smallest backward key is a lower bound on its length. mu is the best path found through a
+    cell reached from both sides; the search stops once that lower bound reaches mu.
+    Keys are doubled to stay integral.
+
+    @param maze: The maze to execute the search on.
+    @param stats: optional SearchStats collector
+
+    @return path: a list of tuples containing the coordinates of each state in the computed path
+    """
+    cells = singleGoal(maze)
+    if cells is None:
+        return astar(maze, stats=stats)
+    if stats is None:
+        stats = SearchStats()
+    startCell, goalCell = cells
+    if startCell == goalCell:
+        return [maze.getPosition(startCell)]
+
+    trace = stats.trace
+    cellCount = maze.getCellCount()
+    startPosition, goalPosition = maze.getPosition(startCell), maze.getPosition(goalCell)
+    # Doubled potential of a cell for the forward side; the backward side uses its opposite
+    def potential(cell):
+        position = maze.getPosition(cell)
+        return manhattanDistance(position, goalPosition) - manhattanDistance(position, startPosition)
+    potential = stats.heuristic(potential)
+
+    parents = (array('i', [-1]) * cellCount, array('i', [-1]) * cellCount)
+    gValues = ({startCell: 0}, {goalCell: 0})
+    closed = (bytearray(cellCount), bytearray(cellCount))
+    fringes = (IndexedPriorityQueue(), IndexedPriorityQueue())
+    signs = (1, -1)
+    for side, cell in ((0, startCell), (1, goalCell)):
+        parents[side][cell] = cell
+        fringes[side].push(cell, (signs[side] * potential(cell), 0))
+
+    mu, meetCell = -1, -1
+    while not fringes[0].isEmpty() and not fringes[1].isEmpty():
+        stats.observeFrontier(len(fringes[0]) + len(fringes[1]))
+        if mu >= 0 and fringes[0].peek()[1][0] + fringes[1].peek()[1][0] >= 2 * mu:
+            break
+        side = 0 if len(fringes[0]) <= len(fringes[1]) else 1
+        fringe, ownG, otherG, sign = fringes[side], gValues[side], gValues[1 - side], signs[side]
+        cell, _ = fringe.pop()
+        closed[side][cell] = 1
+        stats.expanded += 1
+        if trace is not None:
+            trace.expand(cell)
+        gNeighbor = ownG[cell] + 1
+        for neighbor in maze.getNeighborIds(cell):
+            if closed[side][neighbor] or gNeighbor >= ownG.get(neighbor, gNeighbor + 1):
+                continue
+            ownG[neighbor] = gNeighbor
+            parents[side][neighbor] = cell
+            # Ties on the key are broken towards deeper cells
+            fringe.push(neighbor, (2 * gNeighbor + sign * potential(neighbor), -gNeighbor))
+            stats.generated += 1
+            if trace is not None:
+                trace.push(neighbor)
+            if neighbor in otherG and (mu < 0 or gNeighbor + otherG[neighbor] < mu):
+                mu, meetCell = gNeighbor + otherG[neighbor], neighbor
+
+    if meetCell < 0:
+        return []
+    return toPositions(maze, joinPaths(meetCell, parents[0], parents[1]))
+
+# Directions as (row step, col step)
+HORIZONTAL_DIRECTIONS = ((0, 1), (0, -1))
+ALL_DIRECTIONS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+# Scans from (row, col) in direction (dr, dc) and returns the first jump point as (row, col, steps),
+# or None if a wall is hit first. Jump points are goals and, when moving horizontally, cells with a
+# forced vertical neighbor (open, while the same side of the previous cell is a wall). Moving
+# vertically, a cell is a jump point if a horizontal scan from it finds one.
+def jump(maze, row, col, dr, dc, goalCells):
+    isOpen, cols = maze.isValidMove, maze.cols
+    steps = 0
+    while True:
+        row += dr
+        col += dc
+        steps += 1
+        if not isOpen(row, col):
+            return None
+        if row * cols + col in goalCells:
+            return row, col, steps
+        if dc:
+            for side in (-1, 1):
+                if isOpen(row + side, col) and not isOpen(row + side, col - dc):
+                    return row, col, steps
+        else:
+            for hc in (-1, 1):
+                if jump(maze, row, col, 0, hc, goalCells) is not None:
+                    return row, col, steps
+
+# Directions to scan from a jump point reached by moving in direction (dr, dc) ((0, 0) at the start):
+# horizontal moves keep going and only turn at forced neighbors, vertical moves may also turn sideways
+def jumpDirections(maze, row, col, dr, dc):
+    if dr == 0 and dc == 0:
+        return ALL_DIRECTIONS
+    if dc == 0:
+        return ((dr, 0),) + HORIZONTAL_DIRECTIONS
+    directions = [(0, dc)]
+    for side in (-1, 1):
+        if maze.isValidMove(row + side, col) and not maze.isValidMove(row + side, col - dc):
+            directions.append((side, 0))
+    return directions
+
+# A* over jump points from startCell to the nearest of goalCells (Jump Point Search for
+# 4-connected grids). Returns the cell ids of the full path, or [] if no goal can be reached.
+# The directions scanned from a jump point depend on how it was entered, so search states are
+# (cell, entry direction) pairs encoded as cell * 5 + index in (0, 0) + ALL_DIRECTIONS.
+def jumpPointSearch(maze, startCell, goalCells, stats=None):
+    if stats is None:
+        stats = SearchStats()
+    trace = stats.trace
+    cols = maze.cols
+    entryDirections = ((0, 0),) + ALL_DIRECTIONS
+    objectivePositions = toPositions(maze, goalCells)
+    estimate = stats.heuristic(closestManhattan)
+    startState = startCell * 5
+    parents = {startState: startState}
+    gValues = {startState: 0}
+    closed = set()
+    fringe = IndexedPriorityQueue()
+    hStart = estimate(maze.getPosition(startCell), objectivePositions)
+    fringe.push(startState, (hStart, hStart))
+    while not fringe.isEmpty():
+        stats.observeFrontier(len(fringe))
+        state, (fValue, hValue) = fringe.pop()
+        closed.add(state)
+        cell, entry = divmod(state, 5)
+        if cell in goalCells:
+            # Fill in the straight runs between consecutive jump points
+            path = [startCell]
+            for jumpState in reconstructPath(state, parents)[1:]:
+                target = jumpState // 5
+                step = cols if target - path[-1] >= cols else -cols if path[-1] - target >= cols else 1 if target > path[-1] else -1
+                while path[-1] != target:
+                    path.append(path[-1] + step)
+            return path
+        maze.addStatesExplored()
+        stats.expanded += 1
+        if trace is not None:
+            trace.expand(cell)
+        row, col = divmod(cell, cols)
+        gValue = fValue - hValue
+        for dr, dc in jumpDirections(maze, row, col, *entryDirections[entry]):
+            found = jump(maze, row, col, dr, dc, goalCells)
+            if found is None:
+                continue
+            jumpRow, jumpCol, steps = found
+            jumpState = (jumpRow * cols + jumpCol) * 5 + entryDirections.index((dr, dc))
+            gJump = gValue + steps
+            if jumpState in closed or gJump >= gValues.get(jumpState, gJump + 1):
+                continue
+            gValues[jumpState] = gJump
+            parents[jumpState] = state
+            hJump = estimate((jumpRow, jumpCol), objectivePositions)
+            fringe.push(jumpState, (gJump + hJump, hJump))
+            stats.generated += 1
+            if trace is not None:
+                trace.push(jumpState // 5)
+    return []
+
+def jps(maze, stats=None):
+    """
+    Runs Jump Point Search, an A* that only expands jump points: straight runs through open
+    areas are scanned without queueing every cell, and symmetric equal-cost paths are pruned.
+    Objectives are visited one after the other, like astar, with path lengths equal to astar's.
+
+    @param maze: The maze to execute the search on.
+    @param stats: optional SearchStats collector
+
+    @return path: a list of tuples containing the coordinates of each state in the computed path
+    """
+    return chaseObjectives(maze, stats=stats, segmentSearch=jumpPointSearch)
+
+# A* over the junction graph of the maze from startCell to the nearest of goalCells. startCell and the
+# goals are nodes of the graph (objectives and the start always are), and edges are weighted by their
+# corridor length. Returns the cell ids of the full path, or [] if no goal can be reached.
+def junctionSearch(maze, startCell, goalCells, stats=None):
+    if stats is None:
+        stats = SearchStats()
+    trace = stats.trace
+    graph = maze.getJunctionGraph()
+    nodeCells, nodeIndex = graph.nodeCells, graph.nodeIndex
+    edgeOffsets, edgeTargets, edgeWeights = graph.edgeOffsets, graph.edgeTargets, graph.edgeWeights
+    objectivePositions = toPositions(maze, goalCells)
+    estimate = stats.heuristic(closestManhattan)
+    startNode = nodeIndex[startCell]
+    # parents[node] is the (previous node, edge taken) pair of the best known way to node
+    parents = {startNode: (startNode, -1)}
+    gValues = {startNode: 0}
+    closed = set()
+    fringe = IndexedPriorityQueue()
+    hStart = estimate(maze.getPosition(startCell), objectivePositions)
+    fringe.push(startNode, (hStart, hStart))
+    while not fringe.isEmpty():
+        stats.observeFrontier(len(fringe))
+        node, (fValue, hValue) = fringe.pop()
+        closed.add(node)
+        if nodeCells[node] in goalCells:
+            edges = []
+            while parents[node][1] >= 0:
+                edges.append(parents[node])
+                node = parents[node][0]
+            path = [startCell]
+            for previous, edge in reversed(edges):
+                path.extend(graph.edgeCells(previous, edge))
+            return path
+        maze.addStatesExplored()
+        stats.expanded += 1
+        if trace is not None:
+            trace.expand(nodeCells[node])
+        gValue = fValue - hValue
+        for edge in range(edgeOffsets[node], edgeOffsets[node + 1]):
+            neighbor = edgeTargets[edge]
+            gNeighbor = gValue + edgeWeights[edge]
+            if neighbor in closed or gNeighbor >= gValues.get(neighbor, gNeighbor + 1):
+                continue
+            gValues[neighbor] = gNeighbor
+            parents[neighbor] = (node, edge)
+            hNeighbor = estimate(maze.getPosition(nodeCells[neighbor]), objectivePositions)
+            fringe.push(neighbor, (gNeighbor + hNeighbor, hNeighbor))
+            stats.generated += 1
+            if trace is not None:
+                trace.push(nodeCells[neighbor])
+    return []
+
+def junction(maze, stats=None):
+    """
+    Runs A* on the junction graph of the maze, where every corridor is one weighted edge, so only
+    junctions, dead ends and objectives are expanded. Objectives are visited one after the other, like
+    astar, and the corridors are expanded back into cells for the returned path.
+
+    @param maze: The maze to execute the search on.
+    @param stats: optional SearchStats collector
+
+    @return path: a list of tuples containing the coordinates of each state in the computed path
+    """
+    return chaseObjectives(maze, stats=stats, segmentSearch=junctionSearch)
+
+def dstar(maze, stats=None):
+    """
+    Runs D* Lite, the incremental planner of replan.py, to the nearest objective, then moves the
+    start there and drops that objective, so each next leg only repairs the cells whose distance
+    changed instead of searching from scratch. Objectives are visited nearest first, like astar.
 
     @param maze: The maze to execute the search on.
+    @param stats: optional SearchStats collector
 
     @return path: a list of tuples containing the coordinates of each state in the computed path
     """
-    ## Retrieving the starting position 
-    startPosition = Maze.getStart(maze)
-
-    # Retrieving the objectives position
-    objectivePositions = Maze.getObjectives(maze)
-
-    # Declaring reached objectives
-    reachedObjectives = []
-
-    # Not explored yet position
-    fringePriorityQueue = PriorityQueue()
-
-    # Already explored position
-    exploredPositionList = [(startPosition, (-1,-1))]
-    
-    # Declaring the pathList 
-    pathList = [startPosition]
-
-    # Adding the first neighbors in the unexplored position
-    positionNeighbors = Maze.getNeighbors(maze, startPosition[0], startPosition[1])
-    for r, c in positionNeighbors:
-            fValueNeighbor = closestObjective((r,c), objectivePositions, manhattanDistance)[1] + 1
-            fringePriorityQueue.put((fValueNeighbor, (r,c), startPosition))
-    # Iterating till all the objectives are in the path
-    while (True):
-        # Checking if there is a solution
-        if (fringePriorityQueue.empty()):
+    planner = DStarLite(maze, stats=stats)
+    path = [maze.getStart()]
+    remaining = set(maze.getObjectives())
+    remaining.discard(path[0])
+    planner.removeGoal(path[0])
+    while remaining:
+        segment = planner.getPath()
+        if not segment:
             return []
-        # Retrieving the next position 
-        nextPosition = fringePriorityQueue.get()
-        # g-value of the next position
-        gValueNextPosition = nextPosition[0] - closestObjective(nextPosition[1], objectivePositions, manhattanDistance)[1]
-        # Adding the next position in the explored
-        exploredPositionList.append((nextPosition[1], nextPosition[2]))
-        # If the next position is an objective then add it to the list of reached objectives
-        if (nextPosition[1] in objectivePositions) and not(nextPosition[1] in reachedObjectives):
-            reachedObjectives.append(nextPosition[1])
-            newPath = reconstructPath((nextPosition[1], nextPosition[2]), startPosition, exploredPositionList, objectivePositions)
-            newPath.pop(0)
-            pathList = pathList + newPath
-            # We reached an objectif, now we have to reach another one
-            startPosition = nextPosition[1]
-            fringePriorityQueue = PriorityQueue()
-            exploredPositionList = [(nextPosition[1], (-1,-1))]
-        # The objectives are all reached track back the path
-        if objectiveAchieved(objectivePositions, reachedObjectives) :
-            return pathList
-        # Retrieving all the neighbors of the next position
-        newNeighbors = Maze.getNeighbors(maze, nextPosition[1][0], nextPosition[1][1])
-        # Adding the neighbors to the fringe 
-        for r,c in newNeighbors :
-            if containsPosition((r,c), exploredPositionList) == -1:
-                isInFringe, fValueInFringe, ancestorPosition = queueContains(fringePriorityQueue.queue, (r,c))
-                fValueNeighbor = closestObjective((r,c), objectivePositions, manhattanDistance)[1] + gValueNextPosition + 1
-                if isInFringe and (fValueNeighbor < fValueInFringe) :
-                    fringePriorityQueue.queue.remove((fValueInFringe, (r,c), ancestorPosition))
-                    fringePriorityQueue.put((fValueNeighbor, (r,c), nextPosition[1]))
-                else :
-                    fringePriorityQueue.put((fValueNeighbor, (r,c), nextPosition[1]))
-
-def astar_corner(maze):
+        path.extend(segment[1:])
+        remaining.discard(segment[-1])
+        planner.moveStart(segment[-1])
+        planner.removeGoal(segment[-1])
+    return path
+
+# Largest number of objectives solved exactly by heldKarpOrder (the table has 2^n * n entries)
+HELD_KARP_LIMIT = 16
+
+# Returns the order of the objectives that minimizes the length of the walk from the start through
+# all of them, by Held-Karp dynamic programming over the oracle's goal distance matrix
+def heldKarpOrder(oracle):
+    goalCount = oracle.goalCount
+    if goalCount == 0:
+        return []
+    distances = oracle.goalMatrix()
+    # cost[mask][last]: shortest walk from the start visiting the goals of mask and ending at last
+    cost = [[-1] * goalCount for _ in range(1 << goalCount)]
+    previous = [[-1] * goalCount for _ in range(1 << goalCount)]
+    for goal in range(goalCount):
+        cost[1 << goal][goal] = oracle.nodeDistance(oracle.startIndex, goal)
+    for mask in range(1, 1 << goalCount):
+        row = cost[mask]
+        for last in range(goalCount):
+            lastCost = row[last]
+            if lastCost < 0:
+                continue
+            lastDistances = distances[last]
+            for goal in range(goalCount):
+                if mask >> goal & 1:
+                    continue
+                nextMask = mask | 1 << goal
+                nextCost = lastCost + lastDistances[goal]
+                if cost[nextMask][goal] < 0 or nextCost < cost[nextMask][goal]:
+                    cost[nextMask][goal] = nextCost
+                    previous[nextMask][goal] = last
+
+    fullMask = (1 << goalCount) - 1
+    last = min(range(goalCount), key=lambda goal: cost[fullMask][goal])
+    order, mask = [], fullMask
+    while last >= 0:
+        order.append(last)
+        last, mask = previous[mask][last], mask & ~(1 << last)
+    order.reverse()
+    return order
+
+def astar_corner(maze, stats=None):
     """
     Runs A star for part 2 of the assignment in the case where there are four corner objectives.
 
+    With few objectives the optimal visiting order is a small travelling salesman problem:
+    it is solved exactly by heldKarpOrder and the shortest paths between consecutive
+    objectives are read off the distance oracle. Larger objective sets go to astar_multi.
+
     @param maze: The maze to execute the search on.
+    @param stats: optional SearchStats collector
 
     @return path: a list of tuples containing the coordinates of each state in the computed path
         """
-    
-    ## Retrieving the starting position 
-    startPosition = Maze.getStart(maze)
-
-    # Retrieving the objectives position
-    objectivePositions = Maze.getObjectives(maze)
-
-    # Declaring reached objectives
-    reachedObjectives = []
-
-    # Not explored yet position
-    fringePriorityQueue = PriorityQueue()
-
-    # Already explored position
-    exploredPositionList = [(startPosition, (-1,-1))]
-    
-    # Declaring the pathList 
-    pathList = [startPosition]
-
-    # Adding the first neighbors in the unexplored position
-    positionNeighbors = Maze.getNeighbors(maze, startPosition[0], startPosition[1])
-    for r, c in positionNeighbors:
-            fValueNeighbor = closestObjective((r,c), objectivePositions, manhattanDistance)[1] + 1
-            fringePriorityQueue.put((fValueNeighbor, (r,c), startPosition))
-    # Iterating till all the objectives are in the path
-    while (True):
-        # Checking if there is a solution
-        if (fringePriorityQueue.empty()):
-            return []
-        # Retrieving the next position 
-        nextPosition = fringePriorityQueue.get()
-        # g-value of the next position
-        gValueNextPosition = nextPosition[0] - closestObjective(nextPosition[1], objectivePositions, manhattanDistance)[1]
-        # Adding the next position in the explored
-        exploredPositionList.append((nextPosition[1], nextPosition[2]))
-        # If the next position is an objective then add it to the list of reached objectives
-        if (nextPosition[1] in objectivePositions) and not(nextPosition[1] in reachedObjectives):
-            reachedObjectives.append(nextPosition[1])
-            newPath = reconstructPath((nextPosition[1], nextPosition[2]), startPosition, exploredPositionList, objectivePositions)
-            newPath.pop(0)
-            pathList = pathList + newPath
-            # We reached an objectif, now we have to reach another one
-            startPosition = nextPosition[1]
-            fringePriorityQueue = PriorityQueue()
-            exploredPositionList = [(nextPosition[1], (-1,-1))]
-            objectivePositions.remove(nextPosition[1])
-        # The objectives are all reached return the pathList
-        if len(objectivePositions) == 0 :
-            return pathList
-        # Retrieving all the neighbors of the next position
-        newNeighbors = Maze.getNeighbors(maze, nextPosition[1][0], nextPosition[1][1])
-        # Adding the neighbors to the fringe 
-        for r,c in newNeighbors :
-            if containsPosition((r,c), exploredPositionList) == -1:
-                isInFringe, fValueInFringe, ancestorPosition = queueContains(fringePriorityQueue.queue, (r,c))
-                fValueNeighbor = closestObjective((r,c), objectivePositions, manhattanDistance)[1] + gValueNextPosition + 1
-                if isInFringe and (fValueNeighbor < fValueInFringe) :
-                    fringePriorityQueue.queue.remove((fValueInFringe, (r,c), ancestorPosition))
-                    fringePriorityQueue.put((fValueNeighbor, (r,c), nextPosition[1]))
-                else :
-                    fringePriorityQueue.put((fValueNeighbor, (r,c), nextPosition[1]))
-
-
-def astar_multi(maze):
+    if len(maze.getObjectiveCells()) > HELD_KARP_LIMIT:
+        return astar_multi(maze, stats=stats)
+    oracle = getOracle(maze, stats)
+    if not oracle.allReachable():
+        return []
+    return toPositions(maze, oracle.stitchTour(heldKarpOrder(oracle)))
+
+
+# Start state of the searches over (cell, remaining objectives bitmask) states, encoded as the single
+# integer cell + mask * cellCount. Returns the distance oracle of the maze and the start state, or -1
+# instead of the state if an objective cannot be reached.
+def multiGoalStart(maze, stats=None):
+    oracle = getOracle(maze, stats)
+    if not oracle.allReachable():
+        return oracle, -1
+    startCell = maze.getCellId(*maze.getStart())
+    startMask = maze.getObjectiveMask()
+    startBit = maze.getObjectiveBit(startCell)
+    if startBit >= 0:
+        startMask &= ~(1 << startBit)
+    return oracle, startCell + startMask * maze.getCellCount()
+
+# Yields the (neighbor cell, remaining objectives, state) successors of a (cell, remaining objectives) state
+def multiGoalSuccessors(maze, state, cellCount):
+    mask, cell = divmod(state, cellCount)
+    for neighbor in maze.getNeighborIds(cell):
+        neighborMask = mask
+        bit = maze.getObjectiveBit(neighbor)
+        if bit >= 0:
+            neighborMask &= ~(1 << bit)
+        yield neighbor, neighborMask, neighbor + neighborMask * cellCount
+
+# Convert a list of (cell, remaining objectives) states into (row, col) positions
+def statePositions(maze, states, cellCount):
+    return [maze.getPosition(state % cellCount) for state in states]
+
+def astar_multi(maze, weight=1, stats=None):
     """
     Runs A star for part 3 of the assignment in the case where there are
     multiple objectives.
 
+    States are (cell, remaining objectives bitmask) pairs, encoded as the single
+    integer cell + mask * cellCount, and the heuristic is the distance oracle's
+    mstHeuristic over true maze distances, so the returned path is optimal.
+    With a weight above 1 this is weighted A* (see wastar).
+
     @param maze: The maze to execute the search on.
+    @param weight: heuristic weight, f = g + weight * h
+    @param stats: optional SearchStats collector
 
     @return path: a list of tuples containing the coordinates of each state in the computed path
     """
-    return astar_corner(maze)
+    if stats is None:
+        stats = SearchStats()
+    oracle, startState = multiGoalStart(maze, stats)
+    if startState < 0:
+        return []
+    cellCount = maze.getCellCount()
+    startMask, startCell = divmod(startState, cellCount)
+
+    mstHeuristic = stats.heuristic(oracle.mstHeuristic)
+    trace = stats.trace
+    parents = {startState: startState}
+    gValues = {startState: 0}
+    fringe = IndexedPriorityQueue()
+    hStart = mstHeuristic(startCell, startMask)
+    fringe.push(startState, (weight * hStart, hStart))
+    while not fringe.isEmpty():
+        stats.observeFrontier(len(fringe))
+        state, _ = fringe.pop()
+        mask, cell = divmod(state, cellCount)
+        if mask == 0:
+            if weight != 1:
+                cost = gValues[state]
+                lowerBound = min((gValues[item] + hValue for item, (_, hValue) in fringe), default=cost)
+                stats.costBound = costBound(cost, max(hStart, min(lowerBound, cost)))
+            return statePositions(maze, reconstructPath(state, parents), cellCount)
+        stats.expanded += 1
+        if trace is not None:
+            trace.expand(cell)
+        gNeighbor = gValues[state] + 1
+        for neighbor, neighborMask, neighborState in multiGoalSuccessors(maze, state, cellCount):
+            if gNeighbor < gValues.get(neighborState, gNeighbor + 1):
+                # A known state that left the frontier was expanded already
+                if neighborState in gValues and neighborState not in fringe:
+                    stats.reopened += 1
+                gValues[neighborState] = gNeighbor
+                parents[neighborState] = state
+                hNeighbor = mstHeuristic(neighbor, neighborMask)
+                stats.generated += 1
+                if trace is not None:
+                    trace.push(neighbor)
+                # Ties on f are broken towards smaller h, i.e. deeper states
+                fringe.push(neighborState, (gNeighbor + weight * hNeighbor, hNeighbor))
+    return []
+
+
+# Largest number of states kept in the idastar transposition table
+IDASTAR_TABLE_SIZE = 1 << 16
+
+def idastar(maze, tableSize=IDASTAR_TABLE_SIZE, stats=None):
+    """
+    Runs IDA* over the same (cell, remaining objectives) states and mstHeuristic as astar_multi,
+    so the returned path is optimal as well. Each iteration is a depth-first search bounded by f,
+    and only the current path and its unexpanded siblings are kept, so memory grows with the path
+    depth instead of the number of states. A transposition table of at most tableSize states
+    (state -> smallest g seen in the iteration) cuts the re-expansion of states reached twice.
 
+    @param maze: The maze to execute the search on.
+    @param tableSize: largest number of entries in the transposition table
+    @param stats: optional SearchStats collector
 
-def fast(maze):
+    @return path: a list of tuples containing the coordinates of each state in the computed path
     """
-    Runs suboptimal search algorithm for part 4.
+    if stats is None:
+        stats = SearchStats()
+    oracle, startState = multiGoalStart(maze, stats)
+    if startState < 0:
+        return []
+    cellCount = maze.getCellCount()
+    startMask, startCell = divmod(startState, cellCount)
+    if startMask == 0:
+        return [maze.getPosition(startCell)]
+
+    mstHeuristic = stats.heuristic(oracle.mstHeuristic)
+    trace = stats.trace
+
+    # Successors of a state at depth g as (f, h, state), best last so that pop() takes it
+    def successors(state, g):
+        children = []
+        for neighbor, neighborMask, neighborState in multiGoalSuccessors(maze, state, cellCount):
+            hNeighbor = mstHeuristic(neighbor, neighborMask)
+            children.append((g + 1 + hNeighbor, hNeighbor, neighborState))
+        children.sort(reverse=True)
+        stats.expanded += 1
+        stats.generated += len(children)
+        if trace is not None:
+            trace.expand(state % cellCount)
+            for _, _, child in children:
+                trace.push(child % cellCount)
+        return children
+
+    bound = mstHeuristic(startCell, startMask)
+    while True:
+        table = {startState: 0}
+        path = [startState]
+        stack = [successors(startState, 0)]
+        nextBound = None
+        while stack:
+            children = stack[-1]
+            if not children:
+                stack.pop()
+                path.pop()
+                continue
+            fValue, hValue, state = children.pop()
+            if fValue > bound:
+                # The other children are sorted after this one and exceed the bound as well
+                if nextBound is None or fValue < nextBound:
+                    nextBound = fValue
+                children.clear()
+                continue
+            g = len(path)
+            if table.get(state, g + 1) <= g:
+                continue
+            if len(table) < tableSize or state in table:
+                table[state] = g
+            path.append(state)
+            if state < cellCount:
+                return statePositions(maze, path, cellCount)
+            stats.observeFrontier(len(path))
+            stack.append(successors(state, g))
+        if nextBound is None:
+            return []
+        bound = nextBound
+
+
+# Weight used by wastar and focal when none is given
+DEFAULT_WEIGHT = 1.5
+
+def wastar(maze, weight=DEFAULT_WEIGHT, stats=None):
+    """
+    Runs weighted A*: astar_multi with f = g + weight * h. Inflating the heuristic makes the
+    search greedier, and with re-openings the returned path costs at most weight times the optimum.
+
+    The bound reached is usually much tighter: when the goal is taken out of the frontier, every
+    optimal path still has a state in the frontier with its optimal g, so the smallest g + h in
+    the frontier is a lower bound on the optimal cost. The path cost divided by that lower bound
+    is stored in stats.costBound.
+
+    @param maze: The maze to execute the search on.
+    @param weight: heuristic weight, at least 1 (1 is plain A*)
+    @param stats: optional SearchStats collector
+
+    @return path: a list of tuples containing the coordinates of each state in the computed path
+    """
+    if weight < 1:
+        raise ValueError("weight must be at least 1")
+    return astar_multi(maze, weight=weight, stats=stats)
+
+def focal(maze, weight=DEFAULT_WEIGHT, stats=None):
+    """
+    Runs focal search (A*epsilon) over the same (cell, remaining objectives) states and mstHeuristic
+    as astar_multi. The open states are ordered by f = g + h as in A*, and the focal list holds
+    those with f at most weight times the smallest f. Each step expands the focal state with the
+    fewest remaining objectives (then the smallest h), so the search dives towards the objectives
+    while every expansion stays within the bound. The returned path costs at most weight times
+    the optimum.
+
+    The smallest f of the open states is a lower bound on the optimal cost; the path cost divided
+    by the largest such bound seen is stored in stats.costBound.
 
     @param maze: The maze to execute the search on.
+    @param weight: suboptimality bound, at least 1 (1 only breaks the ties of A*)
+    @param stats: optional SearchStats collector
 
     @return path: a list of tuples containing the coordinates of each state in the computed path
     """
+    if weight < 1:
+        raise ValueError("weight must be at least 1")
+    if stats is None:
+        stats = SearchStats()
+    oracle, startState = multiGoalStart(maze, stats)
+    if startState < 0:
+        return []
+    cellCount = maze.getCellCount()
+    startMask, startCell = divmod(startState, cellCount)
+
+    mstHeuristic = stats.heuristic(oracle.mstHeuristic)
+    trace = stats.trace
+    parents = {startState: startState}
+    gValues = {startState: 0}
+    # Every open state is in openStates, keyed by (f, h), and in exactly one of focalStates
+    # (keyed by remaining objectives, then h) and waiting (keyed by (f, h))
+    openStates, focalStates, waiting = IndexedPriorityQueue(), IndexedPriorityQueue(), IndexedPriorityQueue()
+    hStart = mstHeuristic(startCell, startMask)
+    openStates.push(startState, (hStart, hStart))
+    waiting.push(startState, (hStart, hStart))
+    lowerBound = hStart
+    while not openStates.isEmpty():
+        stats.observeFrontier(len(openStates))
+        fMin = openStates.peek()[1][0]
+        lowerBound = max(lowerBound, fMin)
+        limit = weight * fMin
+        while not waiting.isEmpty() and waiting.peek()[1][0] <= limit:
+            state, (fValue, hValue) = waiting.pop()
+            focalStates.push(state, (bin(state // cellCount).count("1"), hValue))
+        state, (_, hValue) = focalStates.pop()
+        fValue = gValues[state] + hValue
+        if fValue > limit:
+            # Only happens if the smallest f went down since the state joined the focal list
+            waiting.push(state, (fValue, hValue))
+            continue
+        openStates.remove(state)
+        mask, cell = divmod(state, cellCount)
+        if mask == 0:
+            stats.costBound = costBound(gValues[state], lowerBound)
+            return statePositions(maze, reconstructPath(state, parents), cellCount)
+        stats.expanded += 1
+        if trace is not None:
+            trace.expand(cell)
+        gNeighbor = gValues[state] + 1
+        for neighbor, neighborMask, neighborState in multiGoalSuccessors(maze, state, cellCount):
+            if gNeighbor < gValues.get(neighborState, gNeighbor + 1):
+                if neighborState in gValues and neighborState not in openStates:
+                    stats.reopened += 1
+                gValues[neighborState] = gNeighbor
+                parents[neighborState] = state
+                hNeighbor = mstHeuristic(neighbor, neighborMask)
+                stats.generated += 1
+                if trace is not None:
+                    trace.push(neighbor)
+                openStates.push(neighborState, (gNeighbor + hNeighbor, hNeighbor))
+                # A lower g keeps a focal state within the bound; other states wait for the next step
+                if neighborState not in focalStates:
+                    waiting.push(neighborState, (gNeighbor + hNeighbor, hNeighbor))
+    return []
+
+# Ratio of a path cost to a lower bound on the optimal cost (1.0 when both are 0)
+def costBound(cost, lowerBound):
+    return cost / lowerBound if lowerBound > 0 else 1.0
+
+
+def fast(maze, timeBudget=1.0, curve=None, weight=None, stats=None):
+    """
+    Runs suboptimal search algorithm for part 4.
+
+    Anytime planner: a nearest-neighbor tour over the distance oracle is improved with
+    2-opt and Or-opt moves (see tours.py) until timeBudget seconds have passed or the
+    tour reaches the oracle's lower bound. With a weight, runs focal search instead, whose path
+    is guaranteed to cost at most weight times the optimum.
 
-    return astar_corner(maze)
+    @param maze: The maze to execute the search on.
+    @param timeBudget: seconds available for improving the tour
+    @param curve: optional list that receives a (seconds, path cost) pair for the first tour
+        and for every improvement
+    @param weight: optional suboptimality bound, see focal
+    @param stats: optional SearchStats collector
+
+    @return path: a list of tuples containing the coordinates of each state in the computed path
+    """
+    if weight is not None:
+        return focal(maze, weight=weight, stats=stats)
+    startTime = time.perf_counter()
+    oracle = getOracle(maze, stats)
+    if not oracle.allReachable():
+        return []
+    distances = oracle.nodeMatrix()
+    order = nearestNeighborTour(oracle.goalCount, distances, oracle.startIndex)
+    order = improveTour(order, distances, oracle.startIndex, startTime + timeBudget,
+                        curve, startTime, oracle.lowerBound())
+    return toPositions(maze, oracle.stitchTour(order))
+
+
+# Search methods selectable with the --method flag of hw1.py
+SEARCH_METHODS = {
+    "bfs": bfs,
+    "astar": astar,
+    "astar_corner": astar_corner,
+    "astar_multi": astar_multi,
+    "fast": fast,
+    "bibfs": bibfs,
+    "biastar": biastar,
+    "jps": jps,
+    "junction": junction,
+    "idastar": idastar,
+    "dstar": dstar,
+    "wastar": wastar,
+    "focal": focal,
+}
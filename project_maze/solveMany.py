@@ -0,0 +1,95 @@
+# solveMany.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains a command line tool that solves many mazes in parallel. Every
+(maze file, method) pair is one task, run by bench.runOne in a process pool
+with its own timeout, and results are printed (and optionally written as JSON
+lines) in completion order, so long sweeps report progress as they go.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from bench import FIELDS, METHODS, printRow, runOne
+
+# Expands the patterns (files, directories or globs) into a sorted list of maze files
+def expandPatterns(patterns):
+    files = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "*.txt*")
+        files.update(name for name in glob.glob(pattern)
+                     if os.path.isfile(name) and (name.endswith(".txt") or name.endswith(".txt.gz")))
+    return sorted(files)
+
+# Runs every (file, method) task over a pool of workers and yields the result rows as they complete.
+# A task whose worker fails yields a row with status "error".
+def solveMany(files, methods, workers=None, timeout=None, options=None):
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        tasks = {}
+        for filename in files:
+            for method in methods:
+                tasks[executor.submit(runOne, filename, method, timeout, options)] = (filename, method)
+        for future in as_completed(tasks):
+            try:
+                yield future.result()
+            except Exception as error:
+                filename, method = tasks[future]
+                row = dict.fromkeys(FIELDS)
+                row.update(maze=filename, method=method, status="error", validation=repr(error))
+                yield row
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='HW1 parallel solver')
+
+    parser.add_argument('patterns', nargs='+',
+                        help='maze files, directories or glob patterns [REQUIRED]')
+    parser.add_argument('--methods', dest="methods", type=str, default=",".join(METHODS),
+                        help='comma separated search methods - default all')
+    parser.add_argument('--workers', dest="workers", type=int, default=None,
+                        help='number of worker processes - default one per CPU')
+    parser.add_argument('--timeout', dest="timeout", type=float, default=60.0,
+                        help='seconds allowed per search - default 60')
+    parser.add_argument('--time-budget', dest="timeBudget", type=float, default=1.0,
+                        help='fast: seconds spent improving the tour - default 1.0')
+    parser.add_argument('--weight', dest="weight", type=float, default=None,
+                        help='astar_multi, wastar, focal: suboptimality bound (fast: run focal search with it) - default 1 for astar_multi, 1.5 otherwise')
+    parser.add_argument('--jsonl', dest="jsonl", type=str, default=None,
+                        help='append every result to a JSON lines file as it completes')
+
+    args = parser.parse_args()
+    files = expandPatterns(args.patterns)
+    if not files:
+        print("No maze files match", " ".join(args.patterns))
+        raise SystemExit(1)
+    options = {"timeBudget": args.timeBudget}
+    if args.weight is not None:
+        options["weight"] = args.weight
+
+    output = open(args.jsonl, "a") if args.jsonl is not None else None
+    print("%-28s %-13s %-8s %6s %9s %8s %9s" % (
+        "maze", "method", "status", "length", "explored", "frontier", "seconds"))
+    failures = 0
+    try:
+        for row in solveMany(files, args.methods.split(","), args.workers, args.timeout, options):
+            printRow(row)
+            # Timeouts are expected for the exact methods on large mazes; wrong paths and crashes are not
+            if row["status"] in ("invalid", "error"):
+                failures += 1
+            if output is not None:
+                output.write(json.dumps(row) + "\n")
+                output.flush()
+    finally:
+        if output is not None:
+            output.close()
+    sys.exit(1 if failures else 0)
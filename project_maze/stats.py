@@ -0,0 +1,187 @@
+# stats.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains the SearchStats class, a collector that the search methods
+of search.py report into while they run: expanded and generated states,
+re-openings and the peak frontier size are always counted. A detailed
+collector also counts and times heuristic evaluations and, around a whole
+search(), measures the total time. Peak memory is measured with tracemalloc
+only when asked for, and then the heuristic is not timed: tracing slows every
+allocation down, so the time split would mostly measure the tracer.
+Explored states are still counted by the Maze itself (getStatesExplored).
+
+It also contains SearchTrace, an optional record of the order in which a search
+expands cells and pushes them into its frontier, kept as one compact array of
+cell ids tagged with the event type and saved as a gzip-compressed file.
+"""
+
+import gzip
+import json
+import sys
+import time
+import tracemalloc
+from array import array
+
+# Event types of a SearchTrace, stored in the lowest bit of each entry
+EXPAND, PUSH = 0, 1
+# Largest number of events recorded by a SearchTrace by default (4 bytes each)
+TRACE_LIMIT = 1 << 24
+
+class SearchStats:
+    # detailed turns on heuristic counting and timing, traceMemory measures the peak memory
+    # instead of timing the heuristic; both slow the search down
+    def __init__(self, detailed=False, traceMemory=False):
+        self.detailed = detailed
+        self.traceMemory = traceMemory
+        self.peakFrontier = 0
+        # States taken out of a frontier and expanded, and successors pushed into one
+        self.expanded = 0
+        self.generated = 0
+        # Expanded states found again with a lower cost and queued again
+        self.reopened = 0
+        self.heuristicCalls = 0
+        self.heuristicSeconds = 0.0
+        self.totalSeconds = 0.0
+        # Largest memory traced during the search, in bytes (traceMemory collectors only)
+        self.peakMemory = 0
+        # Path cost divided by a proven lower bound on the optimal cost, set by the bounded
+        # suboptimal methods (wastar, focal)
+        self.costBound = None
+        # SearchTrace receiving the expansions and pushes of the search cores, or None (the default)
+        self.trace = None
+        self.__tracing = False
+
+    # Records the current number of entries in a search frontier
+    def observeFrontier(self, size):
+        if size > self.peakFrontier:
+            self.peakFrontier = size
+
+    # Returns heuristic wrapped so that its calls are counted and, unless memory is traced, timed,
+    # or heuristic itself if the collector is not detailed
+    def heuristic(self, heuristic):
+        if not self.detailed:
+            return heuristic
+
+        if self.traceMemory:
+            def countedHeuristic(*args):
+                self.heuristicCalls += 1
+                return heuristic(*args)
+            return countedHeuristic
+
+        def timedHeuristic(*args):
+            start = time.perf_counter()
+            value = heuristic(*args)
+            self.heuristicSeconds += time.perf_counter() - start
+            self.heuristicCalls += 1
+            return value
+        return timedHeuristic
+
+    # Starts measuring a whole search: its time, and its peak memory with traceMemory
+    def start(self):
+        if self.traceMemory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.__tracing = True
+        self.__startTime = time.perf_counter()
+
+    # Stops the measures started by start()
+    def stop(self):
+        self.totalSeconds += time.perf_counter() - self.__startTime
+        if self.__tracing:
+            self.peakMemory = max(self.peakMemory, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+            self.__tracing = False
+
+    # Returns the collected statistics as a plain dictionary
+    def asDict(self):
+        values = {"peak_frontier": self.peakFrontier, "expanded": self.expanded,
+                  "generated": self.generated, "reopened": self.reopened}
+        if self.costBound is not None:
+            values["cost_bound"] = round(self.costBound, 6)
+        if self.detailed:
+            values["heuristic_calls"] = self.heuristicCalls
+            if not self.traceMemory:
+                values["heuristic_seconds"] = round(self.heuristicSeconds, 6)
+                # Time spent outside heuristic evaluations: expansions and bookkeeping
+                values["expansion_seconds"] = round(max(self.totalSeconds - self.heuristicSeconds, 0.0), 6)
+        if self.detailed or self.traceMemory:
+            values["total_seconds"] = round(self.totalSeconds, 6)
+        if self.traceMemory:
+            values["peak_memory_bytes"] = self.peakMemory
+        return values
+
+    # Restores the counters saved with asDict (times and memory describe the current run and are kept)
+    def restore(self, values):
+        self.peakFrontier = values.get("peak_frontier", 0)
+        self.expanded = values.get("expanded", 0)
+        self.generated = values.get("generated", 0)
+        self.reopened = values.get("reopened", 0)
+        self.costBound = values.get("cost_bound")
+        self.heuristicCalls = values.get("heuristic_calls", 0)
+
+class SearchTrace:
+    # Records up to limit events; later events are dropped and truncated is set
+    def __init__(self, limit=TRACE_LIMIT):
+        self.limit = limit
+        # Cell id shifted left by one, or-ed with the event type
+        self.events = array('i')
+        self.truncated = False
+        # Cell ids of the path found by the traced search, set by search()
+        self.path = array('i')
+
+    def __len__(self):
+        return len(self.events)
+
+    # Records that a cell was expanded (taken out of the frontier)
+    def expand(self, cell):
+        if len(self.events) < self.limit:
+            self.events.append(cell << 1)
+        else:
+            self.truncated = True
+
+    # Records that a cell was pushed into the frontier
+    def push(self, cell):
+        if len(self.events) < self.limit:
+            self.events.append(cell << 1 | PUSH)
+        else:
+            self.truncated = True
+
+    # Yields the recorded events as (event type, cell id) pairs
+    def replay(self):
+        for entry in self.events:
+            yield entry & 1, entry >> 1
+
+    # Writes the trace to a gzip file: one JSON header line describing the maze, then the events
+    # and the path as little-endian 32-bit integers
+    def save(self, filename, maze, method=None):
+        rows, cols = maze.getDimensions()
+        header = {"rows": rows, "cols": cols, "maze": maze.getContentHash(), "method": method,
+                  "events": len(self.events), "path": len(self.path), "truncated": self.truncated}
+        events, path = array('i', self.events), array('i', self.path)
+        if sys.byteorder != "little":
+            events.byteswap()
+            path.byteswap()
+        with gzip.open(filename, "wb") as f:
+            f.write(json.dumps(header).encode() + b"\n")
+            f.write(events.tobytes())
+            f.write(path.tobytes())
+
+    # Reads a trace written by save and returns it with its header
+    @staticmethod
+    def load(filename):
+        with gzip.open(filename, "rb") as f:
+            header = json.loads(f.readline())
+            trace = SearchTrace()
+            trace.events.frombytes(f.read(4 * header["events"]))
+            trace.path.frombytes(f.read(4 * header["path"]))
+        if len(trace.events) != header["events"] or len(trace.path) != header["path"]:
+            raise ValueError("truncated trace file: " + filename)
+        if sys.byteorder != "little":
+            trace.events.byteswap()
+            trace.path.byteswap()
+        trace.truncated = header["truncated"]
+        return trace, header
@@ -0,0 +1,127 @@
+# tours.py
+# ---------------
+# Licensing Information:  You are free to use or extend this projects for
+# educational purposes provided that (1) you do not distribute or publish
+# solutions, (2) you retain this notice, and (3) you provide clear
+# attribution to the University of Illinois at Urbana-Champaign
+
+"""
+This file contains the tour heuristics used by the fast search method. A tour
+is an order of the objectives, walked from the start without returning, and
+its length is measured on a node distance matrix where node startIndex is the
+start. improveTour is an anytime local search: it returns the best tour found
+when the deadline is reached and records every improvement on the way.
+"""
+
+import random
+import time
+
+# Length of the walk start -> order[0] -> ... -> order[-1]
+def tourLength(order, distances, startIndex):
+    length, previous = 0, startIndex
+    for goal in order:
+        length += distances[previous][goal]
+        previous = goal
+    return length
+
+# Greedy tour: always walk to the nearest objective not visited yet
+def nearestNeighborTour(goalCount, distances, startIndex):
+    remaining = set(range(goalCount))
+    order, current = [], startIndex
+    while remaining:
+        current = min(remaining, key=distances[current].__getitem__)
+        remaining.remove(current)
+        order.append(current)
+    return order
+
+# One pass of 2-opt moves (reverse order[i..j]) on the open tour, first improvement.
+# Returns the total gain, or None if the deadline was hit.
+def twoOptPass(order, distances, startIndex, deadline):
+    gain = 0
+    size = len(order)
+    for i in range(size - 1):
+        if time.perf_counter() > deadline:
+            return None
+        a = order[i - 1] if i > 0 else startIndex
+        rowA = distances[a]
+        for j in range(i + 1, size):
+            b, c = order[i], order[j]
+            before = rowA[b]
+            after = rowA[c]
+            if j + 1 < size:
+                d = order[j + 1]
+                before += distances[c][d]
+                after += distances[b][d]
+            if after < before:
+                order[i:j + 1] = reversed(order[i:j + 1])
+                gain += before - after
+    return gain
+
+# One pass of Or-opt moves: relocate a run of 1 to 3 objectives, possibly reversed, elsewhere
+# in the tour. Returns the total gain, or None if the deadline was hit.
+def orOptPass(order, distances, startIndex, deadline):
+    gain = 0
+    for length in (1, 2, 3):
+        i = 0
+        while i + length <= len(order):
+            if time.perf_counter() > deadline:
+                return None
+            segment = order[i:i + length]
+            before = order[i - 1] if i > 0 else startIndex
+            after = order[i + length] if i + length < len(order) else None
+            # Cost saved by cutting the segment out
+            removed = distances[before][segment[0]]
+            if after is not None:
+                removed += distances[segment[-1]][after] - distances[before][after]
+            rest = order[:i] + order[i + length:]
+            bestDelta, bestMove = 0, None
+            for position in range(len(rest) + 1):
+                p = rest[position - 1] if position > 0 else startIndex
+                q = rest[position] if position < len(rest) else None
+                base = distances[p][q] if q is not None else 0
+                for candidate in (segment, segment[::-1]):
+                    added = distances[p][candidate[0]] - base
+                    if q is not None:
+                        added += distances[candidate[-1]][q]
+                    if added - removed < bestDelta:
+                        bestDelta, bestMove = added - removed, (position, candidate)
+            if bestMove is not None:
+                position, candidate = bestMove
+                order[:] = rest[:position] + candidate + rest[position:]
+                gain -= bestDelta
+            else:
+                i += 1
+    return gain
+
+# Improves order in place with 2-opt and Or-opt until no move helps, then perturbs the best
+# tour with a random segment reversal and starts again, until the deadline (a time.perf_counter
+# value) or the lowerBound is reached. Appends (seconds since startTime, length) to curve on
+# every improvement and returns the best order found.
+def improveTour(order, distances, startIndex, deadline, curve=None, startTime=None, lowerBound=0, seed=0):
+    if startTime is None:
+        startTime = time.perf_counter()
+    generator = random.Random(seed)
+    best = list(order)
+    bestLength = tourLength(best, distances, startIndex)
+    if curve is not None:
+        curve.append((time.perf_counter() - startTime, bestLength))
+    current = list(best)
+    while bestLength > lowerBound:
+        while True:
+            twoOpt = twoOptPass(current, distances, startIndex, deadline)
+            if twoOpt is None:
+                break
+            orOpt = orOptPass(current, distances, startIndex, deadline)
+            if orOpt is None or twoOpt + orOpt == 0:
+                break
+        length = tourLength(current, distances, startIndex)
+        if length < bestLength:
+            best, bestLength = list(current), length
+            if curve is not None:
+                curve.append((time.perf_counter() - startTime, bestLength))
+        if time.perf_counter() > deadline or len(best) < 4:
+            break
+        current = list(best)
+        i, j = sorted(generator.sample(range(len(current)), 2))
+        current[i:j + 1] = reversed(current[i:j + 1])
+    return best
@@ -28,7 +28,6 @@
 
 import sys
 import inspect
-import heapq
 import random
 import io
 
@@ -181,20 +180,55 @@ class PriorityQueue:
     has a priority associated with it and the client is usually interested
     in quick retrieval of the lowest-priority item in the queue. This
     data structure allows O(1) access to the lowest-priority item.
+
+    The heap is indexed by item, so update() is an O(log n) decrease-key
+    instead of a linear scan followed by a heapify. Unhashable items fall
+    back to the linear scan.
+
+    As before, when an item is queued more than once update() only considers
+    the entry that comes first in the heap list. The list is no longer
+    rebuilt by heapify after an update, so which entry comes first can differ
+    from the old implementation after a decrease-key.
     """
 
     def __init__(self):
+        # Heap of [priority, count, item, position] entries
         self.heap = []
+        # item -> queued entries for that item (an item pushed twice has two)
+        self.index = {}
         self.count = 0
 
     def push(self, item, priority):
-        entry = (priority, self.count, item)
-        heapq.heappush(self.heap, entry)
+        entry = [priority, self.count, item, len(self.heap)]
+        self.heap.append(entry)
         self.count += 1
+        self._siftUp(entry[3])
+        try:
+            self.index.setdefault(item, []).append(entry)
+        except TypeError:
+            # Unhashable items are not indexed, update() scans the heap for them
+            pass
 
     def pop(self):
-        (_, _, item) = heapq.heappop(self.heap)
-        return item
+        heap = self.heap
+        entry = heap[0]
+        last = heap.pop()
+        if heap:
+            last[3] = 0
+            heap[0] = last
+            self._siftDown(0)
+        try:
+            entries = self.index.get(entry[2])
+        except TypeError:
+            entries = None
+        if entries is not None:
+            for i, queued in enumerate(entries):
+                if queued is entry:
+                    del entries[i]
+                    break
+            if not entries:
+                del self.index[entry[2]]
+        return entry[2]
 
     def isEmpty(self):
         return len(self.heap) == 0
@@ -203,16 +237,50 @@ class PriorityQueue:
         # If item already in priority queue with higher priority, update its priority and rebuild the heap.
         # If item already in priority queue with equal or lower priority, do nothing.
         # If item not in priority queue, do the same thing as self.push.
-        for index, (p, c, i) in enumerate(self.heap):
-            if i == item:
-                if p <= priority:
-                    break
-                del self.heap[index]
-                self.heap.append((priority, c, item))
-                heapq.heapify(self.heap)
-                break
-        else:
+        try:
+            entries = self.index.get(item)
+        except TypeError:
+            entries = [entry for entry in self.heap if entry[2] == item]
+        if not entries:
             self.push(item, priority)
+            return
+        entry = min(entries, key=lambda entry: entry[3])
+        if priority < entry[0]:
+            entry[0] = priority
+            self._siftUp(entry[3])
+
+    def _siftUp(self, position):
+        heap = self.heap
+        entry = heap[position]
+        while position > 0:
+            parentPosition = (position - 1) >> 1
+            parent = heap[parentPosition]
+            if entry < parent:
+                parent[3] = position
+                heap[position] = parent
+                position = parentPosition
+            else:
+                break
+        entry[3] = position
+        heap[position] = entry
+
+    def _siftDown(self, position):
+        heap = self.heap
+        size = len(heap)
+        entry = heap[position]
+        child = 2 * position + 1
+        while child < size:
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if heap[child] < entry:
+                heap[child][3] = position
+                heap[position] = heap[child]
+                position = child
+                child = 2 * position + 1
+            else:
+                break
+        entry[3] = position
+        heap[position] = entry
 
 
 class PriorityQueueWithFunction(PriorityQueue):